@@ -2,7 +2,7 @@ import logging
 import threading
 import tkinter as tk
 from tkinter import messagebox, ttk
-from typing import Dict, Any
+from typing import Dict, Any, Callable, List
 
 
 from src.core.dependency_container import DependencyContainer
@@ -30,6 +30,7 @@ class Application:
         self.profile_manager = ProfileManager()
         self.container = DependencyContainer()
         self._running = False  # Track running state
+        self._job_listeners: List[Callable[[str], None]] = []  # Notified when a scheduled job completes
         self.setup_logging()
         self.initialize_database()
         self.setup_dependencies()
@@ -181,23 +182,40 @@ class Application:
         # Register attendance collection job
         scheduler.register_job(
             'attendance_collection',
-            lambda: self.container.get('attendance_service').collect_attendance()
+            lambda: self._run_job('attendance_collection',
+                                  self.container.attendance_service.collect_attendance)
         )
 
         # Register attendance upload job
         scheduler.register_job(
             'attendance_upload',
-            lambda: self.container.get('sync_service').upload_attendance_to_api()
+            lambda: self._run_job('attendance_upload',
+                                  self.container.sync_service.upload_attendance_to_api)
         )
 
         # Register user import job
         scheduler.register_job(
             'user_import',
-            lambda: self.container.get('sync_service').import_users_from_api_to_device()
+            lambda: self._run_job('user_import',
+                                  self.container.sync_service.import_users_from_api_to_device)
         )
 
         logger.info("Scheduled jobs registered")
 
+    def add_job_listener(self, listener: Callable[[str], None]) -> None:
+        """Register a callback invoked with the job name each time a scheduled job completes."""
+        self._job_listeners.append(listener)
+
+    def _run_job(self, name: str, task: Callable[[], Any]) -> Any:
+        """Run a scheduled job, then notify listeners from the scheduler thread."""
+        result = task()
+        for listener in self._job_listeners:
+            try:
+                listener(name)
+            except Exception as e:
+                logger.error(f"Error notifying job listener for {name}: {e}")
+        return result
+
     def is_running(self) -> bool:
         """Check if the application services are currently running.
 
@@ -17,11 +17,13 @@ class DependencyContainer:
     def register(self, name: str, instance: Any) -> None:
         """Register a service instance."""
         self._service[name] = instance
+        self.__dict__.pop(name, None)  # Drop any attribute cached for a previous instance
         logger.debug(f"Registered service: {name}")
 
     def register_factory(self, name: str, factory: callable) -> None:
         """Register a factory function that creates a service instance."""
         self._factories[name] = factory
+        self.__dict__.pop(name, None)
         logger.debug(f"Registered factory: {name}")
 
     def get(self, name: str) -> Any:
@@ -39,6 +41,15 @@ class DependencyContainer:
         logger.error(f"Service not found: {name}")
         raise KeyError(f"Service not found: {name}")
 
+    def __getattr__(self, name: str) -> Any:
+        """Get a service as an attribute, caching it so later reads skip the lookup."""
+        # Only called when normal attribute lookup fails, so methods are never shadowed
+        if name.startswith('_') or (name not in self._service and name not in self._factories):
+            raise AttributeError(f"Service not found: {name}")
+        instance = self.get(name)
+        self.__dict__[name] = instance
+        return instance
+
     def get_typed(self, name: str, expected_type: Type[T]) -> T:
         """Get a service by name with type checking."""
         service = self.get(name)
@@ -52,8 +63,11 @@ class DependencyContainer:
             del self._service[name]
         if name in self._factories:
             del self._factories[name]
+        self.__dict__.pop(name, None)
 
     def clear(self) -> None:
         """Clear all registered service."""
+        for name in list(self._service) + list(self._factories):
+            self.__dict__.pop(name, None)
         self._service.clear()
         self._factories.clear()
\ No newline at end of file
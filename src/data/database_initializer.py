@@ -116,6 +116,12 @@ class DatabaseInitializer:
                 logger.info("Upgrading schema: Adding 'errors' column to attendance_records")
                 cursor.execute("ALTER TABLE attendance_records ADD COLUMN errors TEXT")
 
+            # Indexes backing the records list's status filter and column sorts (timestamp is UNIQUE, so already indexed)
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_attendance_processed_timestamp "
+                           "ON attendance_records (processed, timestamp)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_attendance_username ON attendance_records (username)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_attendance_punch_type ON attendance_records (punch_type)")
+
             conn.commit()
             logger.info("Database schema checked and upgraded if needed")
 
@@ -1,6 +1,6 @@
 # src/data/repositories.py
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime
 
 from src.domain.models import AttendanceRecord, User, Config, APIUploadLog, ProcessedStatus
@@ -24,14 +24,24 @@ class AttendanceRepository(ABC):
     """Interface for attendance record data access."""
 
     @abstractmethod
-    def get_records(self, processed_status: Optional[str] = None, order_by: str = 'timestamp') -> List[
-        AttendanceRecord]:
-        """Get attendance records with optional filtering."""
+    def get_records(self, processed_status: Optional[str] = None, order_by: str = 'timestamp',
+                    search: Optional[str] = None, limit: Optional[int] = None,
+                    offset: int = 0, descending: bool = False,
+                    after: Optional[Tuple[Any, int]] = None) -> List[AttendanceRecord]:
+        """Get attendance records with optional filtering, search and paging.
+
+        after is the (order_by value, id) of the last record already read; only records past it in the sort are returned.
+        """
+        pass
+
+    @abstractmethod
+    def count_records(self, processed_status: Optional[str] = None, search: Optional[str] = None) -> int:
+        """Count the attendance records matching the same filters as get_records."""
         pass
 
     @abstractmethod
     def save_record(self, record: AttendanceRecord) -> AttendanceRecord:
-        """Save an attendance record."""
+        """Save an attendance record and return it with its generated id set."""
         pass
 
     @abstractmethod
@@ -44,6 +54,11 @@ class AttendanceRepository(ABC):
         """Update an attendance record."""
         pass
 
+    @abstractmethod
+    def update_records(self, records: List[AttendanceRecord]) -> None:
+        """Update multiple attendance records in a single transaction."""
+        pass
+
     @abstractmethod
     def delete_record(self, record_id: int) -> None:
         """Delete an attendance record."""
@@ -4,7 +4,7 @@ import json
 import logging
 import os
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 
 from src.data.repository_base import SQLiteRepositoryBase
 from src.domain.models import AttendanceRecord, User, Config, APIUploadLog, ProcessedStatus
@@ -13,6 +13,11 @@ from src.data.repositories import ConfigRepository, AttendanceRepository, UserRe
 logger = logging.getLogger(__name__)
 
 
+def _py_lower(value):
+    """Lowercase text with Python's Unicode rules, for SQL (SQLite's lower() and LIKE only fold ASCII)."""
+    return value.lower() if isinstance(value, str) else value
+
+
 class SQLiteRepository:
     """Base class for SQLite repositories."""
 
@@ -125,20 +130,83 @@ class SQLiteConfigRepository(SQLiteRepositoryBase, ConfigRepository):
 class SQLiteAttendanceRepository(SQLiteRepositoryBase, AttendanceRepository):
     """SQLite implementation of AttendanceRepository."""
 
-    def get_records(self, processed_status: Optional[str] = None, order_by: str = 'timestamp') -> List[
-        AttendanceRecord]:
-        """Get attendance records with optional filtering."""
-        conn = self.get_connection()
-        cursor = conn.cursor()
+    # Older SQLite builds refuse statements with more than 999 bound parameters
+    MAX_IN_PARAMS = 900
+    # Columns get_records may order by; the name is interpolated into the SQL, so it must come from this set
+    SORT_COLUMNS = frozenset({'id', 'username', 'timestamp', 'punch_type', 'processed'})
+
+    def get_connection(self):
+        """Get a database connection, with the pylower() function the record search compares through."""
+        conn = super().get_connection()
+        conn.create_function('pylower', 1, _py_lower, deterministic=True)
+        return conn
 
-        query = 'SELECT * FROM attendance_records'
+    @classmethod
+    def _in_batches(cls, values: List[Any]):
+        """Yield (placeholders, values) slices small enough for one IN (...) clause each."""
+        for start in range(0, len(values), cls.MAX_IN_PARAMS):
+            batch = list(values[start:start + cls.MAX_IN_PARAMS])
+            yield ','.join('?' * len(batch)), batch
+
+    @staticmethod
+    def _records_filter(processed_status: Optional[str], search: Optional[str]):
+        """Build the WHERE clause and parameters shared by get_records and count_records."""
+        clauses = []
         params = []
 
         if processed_status is not None:
-            query += ' WHERE processed = ?'
+            clauses.append('processed = ?')
             params.append(processed_status)
 
-        query += f' ORDER BY {order_by} ASC'
+        if search:
+            # Wildcards in the term are escaped and both sides are lowercased by Python (LIKE only folds ASCII),
+            # so the SQL search matches the same substrings as the UI's in-memory search
+            clauses.append("(pylower(username) LIKE ? ESCAPE '\\' OR pylower(timestamp) LIKE ? ESCAPE '\\')")
+            escaped = search.lower().replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+            pattern = f'%{escaped}%'
+            params.extend((pattern, pattern))
+
+        where = f' WHERE {" AND ".join(clauses)}' if clauses else ''
+        return where, params
+
+    @staticmethod
+    def _after_clause(order_by: str, descending: bool, after: Tuple[Any, int]):
+        """Build the condition selecting the rows sorted after the (order_by value, id) key."""
+        value, record_id = after
+        # SQLite sorts NULLs first, and a row-value comparison with NULL is never true, so they are handled apart
+        if value is None:
+            if descending:
+                return f'({order_by} IS NULL AND id < ?)', [record_id]
+            return f'({order_by} IS NOT NULL OR id > ?)', [record_id]
+        if descending:
+            return f'(({order_by}, id) < (?, ?) OR {order_by} IS NULL)', [value, record_id]
+        return f'({order_by}, id) > (?, ?)', [value, record_id]
+
+    def get_records(self, processed_status: Optional[str] = None, order_by: str = 'timestamp',
+                    search: Optional[str] = None, limit: Optional[int] = None,
+                    offset: int = 0, descending: bool = False,
+                    after: Optional[Tuple[Any, int]] = None) -> List[AttendanceRecord]:
+        """Get attendance records with optional filtering, search and paging."""
+        if order_by not in self.SORT_COLUMNS:
+            raise ValueError(f"Cannot order attendance records by '{order_by}'")
+
+        conn = self.get_connection()
+        cursor = conn.cursor()
+
+        where, params = self._records_filter(processed_status, search)
+        if after is not None:
+            # Keyset paging: rows inserted or updated before the last read one cannot shift the next page
+            clause, after_params = self._after_clause(order_by, descending, after)
+            where = f'{where} AND {clause}' if where else f' WHERE {clause}'
+            params.extend(after_params)
+
+        # id breaks ties so pages stay stable across LIMIT/OFFSET queries
+        direction = 'DESC' if descending else 'ASC'
+        query = f'SELECT * FROM attendance_records{where} ORDER BY {order_by} {direction}, id {direction}'
+
+        if limit is not None:
+            query += ' LIMIT ? OFFSET ?'
+            params.extend((limit, offset))
 
         cursor.execute(query, params)
         rows = cursor.fetchall()
@@ -160,6 +228,18 @@ class SQLiteAttendanceRepository(SQLiteRepositoryBase, AttendanceRepository):
             for row in rows
         ]
 
+    def count_records(self, processed_status: Optional[str] = None, search: Optional[str] = None) -> int:
+        """Count the attendance records matching the same filters as get_records."""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+
+        where, params = self._records_filter(processed_status, search)
+        cursor.execute(f'SELECT COUNT(*) FROM attendance_records{where}', params)
+        count = cursor.fetchone()[0]
+        conn.close()
+
+        return count
+
     def save_record(self, record: AttendanceRecord) -> AttendanceRecord:
         """Save an attendance record."""
         conn = self.get_connection()
@@ -263,6 +343,39 @@ class SQLiteAttendanceRepository(SQLiteRepositoryBase, AttendanceRepository):
         finally:
             conn.close()
 
+    def update_records(self, records: List[AttendanceRecord]) -> None:
+        """Update multiple attendance records in a single transaction."""
+        if any(not record.id for record in records):
+            raise ValueError("Record ID is required for update")
+
+        conn = self.get_connection()
+        try:
+            cursor = conn.cursor()
+            cursor.executemany('''
+                UPDATE attendance_records
+                SET 
+                    username = ?,
+                    timestamp = ?,
+                    status = ?,
+                    punch_type = ?,
+                    processed = ?,
+                    errors = ?
+                WHERE id = ?
+            ''', [(
+                record.username,
+                record.timestamp,
+                record.status,
+                record.punch_type,
+                record.processed,
+                json.dumps(record.errors) if record.errors else None,
+                record.id
+            ) for record in records])
+
+            conn.commit()
+            logger.info(f"Updated {len(records)} attendance records")
+        finally:
+            conn.close()
+
     def delete_record(self, record_id: int) -> None:
         """Delete an attendance record."""
         conn = self.get_connection()
@@ -276,14 +389,18 @@ class SQLiteAttendanceRepository(SQLiteRepositoryBase, AttendanceRepository):
 
     def delete_records(self, ids: List[int]) -> None:
         """Delete a list of records"""
+        if not ids:
+            return
+
         conn = self.get_connection()
         try:
             cursor = conn.cursor()
-            placeholders = ', '.join('?' * len(ids))
-            query = f'DELETE FROM attendance_records WHERE id IN ({placeholders})'
-            cursor.execute(query, ids)
+            # Large selections are split across statements but still committed together
+            for placeholders, batch in self._in_batches(ids):
+                cursor.execute(f'DELETE FROM attendance_records WHERE id IN ({placeholders})', batch)
             conn.commit()
-            logger.info(f"Deleted attendance records with ids {ids}")
+            logger.info(f"Deleted {len(ids)} attendance records")
+            logger.debug(f"Deleted attendance records with ids {ids}")
         finally:
             conn.close()
 
@@ -296,14 +413,14 @@ class SQLiteAttendanceRepository(SQLiteRepositoryBase, AttendanceRepository):
         try:
             cursor = conn.cursor()
 
-            placeholders = ','.join(['?'] * len(timestamps))
             formatted_timestamps = [ts.replace("T", " ") for ts in timestamps]
 
-            cursor.execute(f'''
-                UPDATE attendance_records 
-                SET processed = ?, errors = NULL
-                WHERE timestamp IN ({placeholders})
-            ''', [status] + formatted_timestamps)
+            for placeholders, batch in self._in_batches(formatted_timestamps):
+                cursor.execute(f'''
+                    UPDATE attendance_records 
+                    SET processed = ?, errors = NULL
+                    WHERE timestamp IN ({placeholders})
+                ''', [status] + batch)
 
             conn.commit()
             logger.info(f"Marked {len(timestamps)} records as {status}")
@@ -319,13 +436,13 @@ class SQLiteAttendanceRepository(SQLiteRepositoryBase, AttendanceRepository):
         try:
             cursor = conn.cursor()
 
-            placeholders = ','.join(['?'] * len(ids))
-
-            cursor.execute(f'''
-                UPDATE attendance_records 
-                SET processed = ?, errors = NULL
-                WHERE id IN ({placeholders})
-            ''', [status] + ids)
+            # One transaction whatever the selection size; the IN list is split to respect SQLite's parameter limit
+            for placeholders, batch in self._in_batches(ids):
+                cursor.execute(f'''
+                    UPDATE attendance_records 
+                    SET processed = ?, errors = NULL
+                    WHERE id IN ({placeholders})
+                ''', [status] + batch)
 
             conn.commit()
             logger.info(f"Marked {len(ids)} records as {status}")
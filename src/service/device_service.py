@@ -1,5 +1,8 @@
 # src/service/device_service.py
 import logging
+import threading
+import time
+from functools import wraps
 from typing import List, Optional, Tuple
 from dataclasses import dataclass
 
@@ -11,6 +14,15 @@ from src.data.repositories import ConfigRepository
 logger = logging.getLogger(__name__)
 
 
+def _device_call(method):
+    """Serialize access to the ZK connection, which is not thread-safe."""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
 @dataclass
 class DeviceConnection:
     """Represents a connection to a ZK device."""
@@ -26,9 +38,17 @@ class DeviceConnection:
 class DeviceService:
     """Service for interacting with ZK devices."""
 
+    # Seconds during which get_users_cached reuses the last user list read from the device
+    USERS_CACHE_TTL = 30
+
     def __init__(self, config_repository: ConfigRepository):
         self.config_repository = config_repository
         self.connection: Optional[DeviceConnection] = None
+        self._lock = threading.RLock()  # Reentrant: get_attendance_records calls get_users
+
+        # User list shared by every window through get_users_cached, with the monotonic time it was read
+        self._users_cache: Optional[List[User]] = None
+        self._users_cache_ts = 0.0
 
     def initialize_connection(self) -> bool:
         """Initialize connection to the device using config."""
@@ -40,6 +60,7 @@ class DeviceService:
         self.connection = DeviceConnection(ip=config.device_ip, port=config.device_port)
         return True
 
+    @_device_call
     def connect(self) -> bool:
         """Connect to the ZK device."""
         if not self.connection:
@@ -54,12 +75,15 @@ class DeviceService:
             logger.error(f"Failed to connect to ZK device: {e}")
             return False
 
+    @_device_call
     def disconnect(self) -> None:
         """Disconnect from the ZK device."""
+        self.invalidate_users_cache()
         if self.connection and self.connection.conn:
             self.connection.conn.disconnect()
             logger.info("Disconnected from ZK device")
 
+    @_device_call
     def get_users(self) -> List[User]:
         """Get users from the device."""
         if not self.connection or not self.connection.conn:
@@ -83,6 +107,26 @@ class DeviceService:
             logger.error(f"Error retrieving users: {e}")
             return []
 
+    @_device_call
+    def get_users_cached(self) -> List[User]:
+        """Get users from the device, reusing the last list if it was read less than USERS_CACHE_TTL ago."""
+        if self._users_cache is not None and time.monotonic() - self._users_cache_ts < self.USERS_CACHE_TTL:
+            return self._users_cache
+
+        users = self.get_users()
+
+        # An empty list usually means the device could not be reached, so don't keep it
+        if users:
+            self._users_cache = users
+            self._users_cache_ts = time.monotonic()
+        return users
+
+    def invalidate_users_cache(self) -> None:
+        """Force the next get_users_cached call to read the device."""
+        self._users_cache = None
+        self._users_cache_ts = 0.0
+
+    @_device_call
     def set_user(self, user_id: int, code: str) -> bool:
         """Add a user to the device."""
         logger.info("Entering The set_user function to save the user to the device")
@@ -92,6 +136,7 @@ class DeviceService:
                 return False
 
         try:
+            self.invalidate_users_cache()
             self.connection.conn.set_user(
                 name=code,
                 user_id=str(user_id)
@@ -102,6 +147,7 @@ class DeviceService:
             logger.error(f"Error setting user: {e}")
             return False
 
+    @_device_call
     def delete_users(self, uids: List[int]) -> bool:
         """Delete multiple users from the device by their UIDs."""
         logger.info(f"Attempting to delete {len(uids)} users from the device")
@@ -110,6 +156,7 @@ class DeviceService:
                 logger.error("Not connected to ZK device")
                 return False
 
+        self.invalidate_users_cache()
         deleted_users = 0
         for uid in uids:
             try:
@@ -126,6 +173,7 @@ class DeviceService:
             return True
 
 
+    @_device_call
     def get_attendance_records(self) -> List[AttendanceRecord]:
         """Get attendance records from the device."""
         if not self.connection or not self.connection.conn:
@@ -162,6 +210,7 @@ class DeviceService:
             logger.error(f"Error retrieving attendance data: {e}")
             return []
 
+    @_device_call
     def clear_attendance(self) -> bool:
         """Clear attendance records from the device."""
         if not self.connection or not self.connection.conn:
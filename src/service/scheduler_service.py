@@ -32,6 +32,7 @@ class SchedulerService:
         self.jobs: Dict[str, ScheduledJob] = {}
         self.running = False
         self.scheduler_thread = None
+        self._stop_event = threading.Event()  # Wakes the scheduler loop as soon as stop() is called
 
     def register_job(
             self,
@@ -100,6 +101,7 @@ class SchedulerService:
 
         # Start scheduler thread
         self.running = True
+        self._stop_event.clear()
         self.scheduler_thread = threading.Thread(target=self._run_scheduler, daemon=True)
         self.scheduler_thread.start()
 
@@ -112,6 +114,7 @@ class SchedulerService:
             return
 
         self.running = False
+        self._stop_event.set()
         schedule.clear()
 
         # Wait for thread to terminate
@@ -124,7 +127,8 @@ class SchedulerService:
         """Run the scheduler loop."""
         while self.running:
             schedule.run_pending()
-            time.sleep(1)
+            if self._stop_event.wait(1):
+                break
 
     def run_job_now(self, job_name: str) -> bool:
         """Run a job immediately."""
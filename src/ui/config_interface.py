@@ -69,6 +69,10 @@ class ConfigInterface:
         # Load existing configuration
         self.load_config()
 
+        # Keep child windows alive when closed so they can be reopened instantly
+        if root:
+            self.root.protocol("WM_DELETE_WINDOW", self.hide)
+
         # Show the window
         self.root.deiconify()
 
@@ -141,10 +145,17 @@ class ConfigInterface:
 
     def show(self):
         """Make the window modal and visible."""
+        self.root.deiconify()
+        self.root.lift()
         self.root.grab_set()
         self.root.transient(self.root.master)
         self.root.focus_set()
 
+    def hide(self):
+        """Hide the window so it can be reopened without being rebuilt."""
+        self.root.grab_release()
+        self.root.withdraw()
+
     def create_card(self, parent, title):
         """Create a card with the given title in the parent frame."""
         # Create an outer frame that will have the background color
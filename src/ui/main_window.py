@@ -7,11 +7,15 @@ from tkinter import ttk, messagebox
 from datetime import datetime
 from typing import Optional, Dict, Any
 import threading
-import tempfile
+import queue
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 import pystray
 from PIL import Image, ImageDraw
 
 from src.ui.config_interface import ConfigInterface
+from src.ui.polling import when_done
 from src.ui.records_interface import RecordsInterface
 from src.ui.users_interface import UsersInterface
 from src.application import Application
@@ -19,6 +23,40 @@ from src.core.profile_manager import ProfileManager
 
 logger = logging.getLogger(__name__)
 
+# Label style used for each status type
+_STYLE_FOR = {
+    'success': 'Success.TLabel',
+    'error': 'Error.TLabel',
+    'warning': 'Warning.TLabel',
+    'neutral': 'Neutral.TLabel',
+}
+
+# Component status changes applied when the service starts or stops:
+# (status var attribute, label attribute, component, status, status type)
+_START_TRANSITIONS = (
+    ('collector_status_var', 'collector_status_label', "Collecteur", "En marche", "success"),
+    ('uploader_status_var', 'uploader_status_label', "Téléchargeur", "En marche", "success"),
+    ('user_importer_status_var', 'user_importer_status_label', "Importateur d'Utilisateurs", "En marche", "success"),
+)
+
+_STOP_TRANSITIONS = (
+    ('collector_status_var', 'collector_status_label', "Collecteur", "Arrêté", "error"),
+    ('uploader_status_var', 'uploader_status_label', "Téléchargeur", "Arrêté", "error"),
+    ('user_importer_status_var', 'user_importer_status_label', "Importateur d'Utilisateurs", "Arrêté", "error"),
+)
+
+# Byte posted by the scheduler thread for each completed job, and the label it refreshes
+_JOB_EVENT_CODES = {
+    'attendance_collection': b'C',
+    'attendance_upload': b'U',
+    'user_import': b'I',
+}
+_JOB_EVENT_LABELS = {
+    ord('C'): ('last_collection_var', "Dernière collecte"),
+    ord('U'): ('last_upload_var', "Dernier téléchargement"),
+    ord('I'): ('last_import_var', "Dernière importation d'utilisateur"),
+}
+
 
 class MainWindow:
     """Main application window with updated modern design and responsive layout."""
@@ -33,6 +71,8 @@ class MainWindow:
     COLOR_CARD = "#FFFFFF"  # White card background
     COLOR_BORDER = "#E0E6ED"  # Soft blue-gray for borders
 
+    _icon_image = None  # Decoded tray image, loaded once and reused by every tray setup
+
     # Minimum dimensions
     MIN_WIDTH = 500
     MIN_HEIGHT = 500
@@ -41,11 +81,31 @@ class MainWindow:
     DEFAULT_WIDTH = 820
     DEFAULT_HEIGHT = 900
 
+    # Seconds during which the last connection test result is trusted by the Start button
+    CONNECTIVITY_CACHE_TTL = 30
+
+    # Maximum seconds to wait for services to stop when quitting from the window
+    EXIT_STOP_TIMEOUT = 5
+
+    # Delay before the tray icon is registered, so it does not hold up the first display of the window
+    TRAY_SETUP_DELAY_MS = 200
+
     def __init__(self, application: Application):
         self.app = application
         self.profile_manager = ProfileManager()  # Add profile manager
+
+        # Services are app-lifetime singletons, resolve them once
+        container = self.app.container
+        self._config_service = container.config_service
+        self._config_repository = container.config_repository
+        self._device_service = container.device_service
+        self._attendance_repository = container.attendance_repository
+        self._attendance_service = container.attendance_service
+        self._sync_service = container.sync_service
+
         self.icon = None  # System tray icon
         self.tray_thread = None  # Thread for tray icon
+        self._tray_label = None  # Info card line showing whether the tray icon is up
         self.exit_requested = False  # Flag to track exit requests
 
         # Create main window
@@ -87,26 +147,29 @@ class MainWindow:
 
         # Connection test status
         self.connectivity_success = False
+        self._conn_state = (False, 0.0)  # (last result, monotonic time it was taken)
 
-        logger.info("Main window initializing")
+        # Worker pool for blocking device/database calls triggered from the UI
+        self._executor = ThreadPoolExecutor(max_workers=2)
+
+        # Channel carrying job completion events from the scheduler thread
+        self._job_event_fd = None
+        self._job_event_queue = None
 
-        # Setup system tray icon
-        self.setup_system_tray()
+        # Widget option changes waiting for the next idle flush
+        self._pending_ui = {}
+        self._batch_depth = 0  # Nesting level of _batch_ui blocks
+
+        # Child windows are built once, then hidden and reused
+        self._config_win = self._users_win = self._records_win = None
+
+        logger.info("Main window initializing")
 
     def setup_system_tray(self):
         """Setup the system tray icon and menu."""
         try:
-            # Get icon path
-            icon_path = self.resource_path("assets/timesync-logo.ico")
-            if not os.path.exists(icon_path):
-                # Fallback to PNG if ICO not available
-                icon_path = self.resource_path("assets/timesync-logo.png")
-                if not os.path.exists(icon_path):
-                    # Create a blank image if icon files aren't available
-                    icon_path = self.create_default_icon()
-
             # Load the icon image
-            icon_image = Image.open(icon_path)
+            icon_image = self.load_icon_image()
 
             # Define menu items
             menu = (
@@ -123,23 +186,39 @@ class MainWindow:
             self.tray_thread = threading.Thread(target=self.icon.run, daemon=True)
             self.tray_thread.start()
 
+            # The info card was built before the icon existed
+            if self._tray_label is not None and self._tray_label.winfo_exists():
+                self._tray_label.config(text="Icône système: Actif")
+
             logger.info("System tray icon initialized")
         except Exception as e:
             logger.error(f"Failed to setup system tray icon: {e}")
             # Continue without the system tray if it fails
 
+    def load_icon_image(self):
+        """Return the tray icon image, reading and decoding it from disk only the first time."""
+        if MainWindow._icon_image is None:
+            # Get icon path
+            icon_path = self.resource_path("assets/timesync-logo.ico")
+            if not os.path.exists(icon_path):
+                # Fallback to PNG if ICO not available
+                icon_path = self.resource_path("assets/timesync-logo.png")
+
+            if os.path.exists(icon_path):
+                image = Image.open(icon_path)
+                image.load()  # Decode now, so the file is not read again later
+            else:
+                # Create a blank image if icon files aren't available
+                image = self.create_default_icon()
+            MainWindow._icon_image = image
+        return MainWindow._icon_image
+
     def create_default_icon(self):
-        """Create a default icon if none is available."""
-        try:
-            img = Image.new('RGB', (64, 64), color=(36, 57, 142))  # Using COLOR_PRIMARY
-            d = ImageDraw.Draw(img)
-            d.text((20, 20), "TS", fill=(255, 255, 255))
-            temp_path = os.path.join(tempfile.gettempdir(), 'temp_icon.png')
-            img.save(temp_path)
-            return temp_path
-        except Exception as e:
-            logger.error(f"Failed to create default icon: {e}")
-            return None
+        """Create a default icon image in memory if none is available; pystray takes it as is."""
+        img = Image.new('RGB', (64, 64), color=(36, 57, 142))  # Using COLOR_PRIMARY
+        d = ImageDraw.Draw(img)
+        d.text((20, 20), "TS", fill=(255, 255, 255))
+        return img
 
     def show_window(self, icon=None, item=None):
         """Show the main window."""
@@ -185,10 +264,17 @@ class MainWindow:
         if self.app.is_running():
             self.app.stop_service()
 
+        self._finish_exit()
+
+    def _finish_exit(self):
+        """Tear down the tray icon and Tk root, then terminate the process."""
         # Stop the icon if it exists
         if self.icon:
             self.icon.stop()
 
+        # Don't wait for pending background work
+        self._executor.shutdown(wait=False)
+
         # Destroy Tkinter root if it exists
         if self.root:
             self.root.destroy()
@@ -200,51 +286,28 @@ class MainWindow:
     def update_ui_status(self):
         """Update UI status based on service state."""
         if self.app.is_running():
-            # Update main status
-            self.status_var.set("Système en marche")
-            if self.status_label:
-                self.status_label.config(style='Success.TLabel')
-
-            # Update component statuses
-            self.update_status(self.collector_status_var, "Collecteur", "En marche", "success")
-            if self.collector_status_label:
-                self.collector_status_label.config(style='Success.TLabel')
-
-            self.update_status(self.uploader_status_var, "Téléchargeur", "En marche", "success")
-            if self.uploader_status_label:
-                self.uploader_status_label.config(style='Success.TLabel')
-
-            self.update_status(self.user_importer_status_var, "Importateur d'Utilisateurs", "En marche", "success")
-            if self.user_importer_status_label:
-                self.user_importer_status_label.config(style='Success.TLabel')
-
-            # Update button states
-            if self.start_button and self.stop_button:
-                self.start_button.config(state=tk.DISABLED)
-                self.stop_button.config(state=tk.NORMAL)
+            status_text, status_type, transitions = "Système en marche", 'success', _START_TRANSITIONS
+            start_state, stop_state = tk.DISABLED, tk.NORMAL
         else:
-            # Update main status
-            self.status_var.set("Système arrêté")
-            if self.status_label:
-                self.status_label.config(style='Error.TLabel')
-
-            # Update component statuses
-            self.update_status(self.collector_status_var, "Collecteur", "Arrêté", "error")
-            if self.collector_status_label:
-                self.collector_status_label.config(style='Error.TLabel')
+            status_text, status_type, transitions = "Système arrêté", 'error', _STOP_TRANSITIONS
+            start_state, stop_state = tk.NORMAL, tk.DISABLED
 
-            self.update_status(self.uploader_status_var, "Téléchargeur", "Arrêté", "error")
-            if self.uploader_status_label:
-                self.uploader_status_label.config(style='Error.TLabel')
+        # Update main status
+        self.status_var.set(status_text)
+        if self.status_label:
+            self.status_label.config(style=_STYLE_FOR[status_type])
 
-            self.update_status(self.user_importer_status_var, "Importateur d'Utilisateurs", "Arrêté", "error")
-            if self.user_importer_status_label:
-                self.user_importer_status_label.config(style='Error.TLabel')
+        # Update component statuses
+        for var_name, label_name, component, status, component_type in transitions:
+            self.update_status(getattr(self, var_name), component, status, component_type)
+            label = getattr(self, label_name)
+            if label:
+                label.config(style=_STYLE_FOR[component_type])
 
-            # Update button states
-            if self.start_button and self.stop_button:
-                self.start_button.config(state=tk.NORMAL)
-                self.stop_button.config(state=tk.DISABLED)
+        # Update button states
+        if self.start_button and self.stop_button:
+            self._queue_ui(self.start_button, state=start_state)
+            self._queue_ui(self.stop_button, state=stop_state)
 
     def setup_ui(self):
         """Set up the modern user interface with environment awareness."""
@@ -384,9 +447,6 @@ class MainWindow:
         # Bind resize event
         self.root.bind("<Configure>", self.on_window_resize)
 
-        # Show the window
-        self.root.deiconify()
-
     def setup_styles(self):
         """Configure ttk styles with environment-specific colors."""
         style = ttk.Style()
@@ -596,8 +656,8 @@ class MainWindow:
 
         # Add system tray status
         tray_status = "Actif" if self.icon else "Non disponible"
-        tray_label = ttk.Label(info_card, text=f"Icône système: {tray_status}", style='Card.TLabel')
-        tray_label.pack(anchor=tk.W, pady=5)
+        self._tray_label = ttk.Label(info_card, text=f"Icône système: {tray_status}", style='Card.TLabel')
+        self._tray_label.pack(anchor=tk.W, pady=5)
 
     def on_window_resize(self, event):
         """Handle window resize events."""
@@ -766,8 +826,7 @@ class MainWindow:
 
     def update_ui_based_on_config(self):
         """Update UI based on configuration existence."""
-        config_service = self.app.container.get('config_service')
-        config = config_service.get_config()
+        config = self._config_service.get_config()
 
         if config:
             self.status_var.set("Système prêt à démarrer")
@@ -779,7 +838,55 @@ class MainWindow:
         else:
             self.status_var.set("Système non configuré")
             self.status_label.config(style='Error.TLabel')
-            self.start_button.config(state=tk.DISABLED)
+            self._queue_ui(self.start_button, state=tk.DISABLED)
+
+    def _resolve_transitions(self, transitions):
+        """Turn a module-level transition table into status and style batches."""
+        statuses = tuple((getattr(self, var_name), component, status, status_type)
+                         for var_name, _, component, status, status_type in transitions)
+        styles = tuple((getattr(self, label_name), _STYLE_FOR[status_type])
+                       for _, label_name, _, _, status_type in transitions)
+        return statuses, styles
+
+    @contextmanager
+    def _batch_ui(self):
+        """Group UI changes so Tk redraws once, when the outermost batch ends."""
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self.root.update_idletasks()
+
+    def update_statuses(self, entries):
+        """Update several status variables at once; entries are (var, component, status, status_type)."""
+        with self._batch_ui():
+            for var, component, status, status_type in entries:
+                self.update_status(var, component, status, status_type)
+
+    def _apply_ui_batch(self, values=(), statuses=(), styles=(), states=()):
+        """Apply a group of variable, style and button state changes, then redraw once."""
+        with self._batch_ui():
+            for var, value in values:
+                var.set(value)
+            self.update_statuses(statuses)
+            for widget, style in styles:
+                widget.configure(style=style)
+            for widget, state in states:
+                self._queue_ui(widget, state=state)
+
+    def _queue_ui(self, widget, **options):
+        """Queue widget option changes so they are applied together on the next idle pass."""
+        if not self._pending_ui:
+            self.root.after_idle(self._flush_ui)
+        self._pending_ui.setdefault(widget, {}).update(options)
+
+    def _flush_ui(self):
+        """Apply every queued widget option change in one go."""
+        pending, self._pending_ui = self._pending_ui, {}
+        for widget, options in pending.items():
+            widget.configure(**options)
 
     def update_status(self, var, component, status, status_type):
         """Update a status variable with formatting."""
@@ -826,161 +933,318 @@ class MainWindow:
         # Update UI to show testing in progress
         self.test_button.config(text="Test en cours...", state=tk.DISABLED)
         self.test_results_var.set("Exécution des tests de connexion...")
-        self.test_results_label.config(style='Warning.TLabel')
-
-        # Update connection status indicators
-        self.update_status(self.device_test_var, "Connexion Appareil", "Test en cours...", "warning")
-        self.device_status_label.config(style='Warning.TLabel')
-        self.update_status(self.api_test_var, "Connexion API", "Test en cours...", "warning")
-        self.api_status_label.config(style='Warning.TLabel')
-
-        # Allow UI to update
-        self.root.update_idletasks()
+        self.test_results_label.config(style=_STYLE_FOR['warning'])
+
+        # Update connection status indicators, then allow UI to update
+        self._apply_ui_batch(
+            statuses=(
+                (self.device_test_var, "Connexion Appareil", "Test en cours...", "warning"),
+                (self.api_test_var, "Connexion API", "Test en cours...", "warning"),
+            ),
+            styles=(
+                (self.device_status_label, _STYLE_FOR['warning']),
+                (self.api_status_label, _STYLE_FOR['warning']),
+            )
+        )
 
         # Run tests
         results = self.app.test_connections()
         self.connectivity_success = results.get('overall', False)
+        self._conn_state = (self.connectivity_success, time.monotonic())
 
         # Update device status
         device_result = results.get('device', {})
         if device_result.get('success', False):
             self.update_status(self.device_test_var, "Connexion Appareil", "Connecté", "success")
-            self.device_status_label.config(style='Success.TLabel')
+            self.device_status_label.config(style=_STYLE_FOR['success'])
         else:
             self.update_status(self.device_test_var, "Connexion Appareil", "Échec", "error")
-            self.device_status_label.config(style='Error.TLabel')
+            self.device_status_label.config(style=_STYLE_FOR['error'])
 
         # Update API status
         api_result = results.get('api', {})
         if api_result.get('success', False):
             self.update_status(self.api_test_var, "Connexion API", "Connectée", "success")
-            self.api_status_label.config(style='Success.TLabel')
+            self.api_status_label.config(style=_STYLE_FOR['success'])
         else:
             self.update_status(self.api_test_var, "Connexion API", "Échec", "error")
-            self.api_status_label.config(style='Error.TLabel')
+            self.api_status_label.config(style=_STYLE_FOR['error'])
 
         # Update overall results
         if self.connectivity_success:
             self.test_results_var.set("✓ Toutes les connexions réussies")
-            self.test_results_label.config(style='Success.TLabel')
+            self.test_results_label.config(style=_STYLE_FOR['success'])
         else:
             self.test_results_var.set("✗ Test de connexion échoué")
-            self.test_results_label.config(style='Error.TLabel')
+            self.test_results_label.config(style=_STYLE_FOR['error'])
 
         # Re-enable test button
         self.test_button.config(text="Relancer les Tests de Connexion", state=tk.NORMAL)
 
         # Update start button state
-        config_service = self.app.container.get('config_service')
-        if self.connectivity_success and config_service.get_config():
-            self.start_button.config(state=tk.NORMAL)
+        if self.connectivity_success and self._config_service.get_config():
+            self._queue_ui(self.start_button, state=tk.NORMAL)
         else:
-            self.start_button.config(state=tk.DISABLED)
+            self._queue_ui(self.start_button, state=tk.DISABLED)
 
     def start_system(self):
         """Start the attendance system."""
-        if not self.connectivity_success:
-            messagebox.showerror("Erreur de Connexion",
-                                 "Impossible de démarrer le système. Veuillez vérifier les connexions.")
+        ok, tested_at = self._conn_state
+        if time.monotonic() - tested_at < self.CONNECTIVITY_CACHE_TTL:
+            if ok:
+                self._do_start_service()
+            else:
+                self._show_connection_error()
             return
 
-        if self.app.start_service():
-            # Update main status
-            self.status_var.set("Système en marche")
-            self.status_label.config(style='Success.TLabel')
+        # The last test is stale, re-check in the background and start only if it passes
+        self.status_var.set("Vérification des connexions…")
+        self._queue_ui(self.start_button, state=tk.DISABLED)
+        fut = self._executor.submit(self.app.test_connections)
 
-            # Update component statuses
-            self.update_status(self.collector_status_var, "Collecteur", "En marche", "success")
-            self.collector_status_label.config(style='Success.TLabel')
+        def _done(fut):
+            try:
+                results = fut.result()
+            except Exception as e:
+                logger.error(f"Error re-testing connections: {e}")
+                results = {}
+            self.connectivity_success = results.get('overall', False)
+            self._conn_state = (self.connectivity_success, time.monotonic())
+            if self.connectivity_success:
+                self._do_start_service()
+            else:
+                self.update_ui_status()
+                self._show_connection_error()
 
-            self.update_status(self.uploader_status_var, "Téléchargeur", "En marche", "success")
-            self.uploader_status_label.config(style='Success.TLabel')
+        when_done(self.root, _done, fut)
 
-            self.update_status(self.user_importer_status_var, "Importateur d'Utilisateurs", "En marche", "success")
-            self.user_importer_status_label.config(style='Success.TLabel')
+    def _show_connection_error(self):
+        """Tell the user the system cannot start because the connections failed."""
+        self._ask("Erreur de Connexion",
+                  "Impossible de démarrer le système. Veuillez vérifier les connexions.")
 
-            # Update button states
-            self.start_button.config(state=tk.DISABLED)
-            self.stop_button.config(state=tk.NORMAL)
+    def _do_start_service(self):
+        """Start the services on the worker pool and apply the result when done."""
+        # Connecting to the device can take a while, do it on the worker pool
+        self.status_var.set("Connexion en cours…")
+        self._queue_ui(self.start_button, state=tk.DISABLED)
+        fut = self._executor.submit(self.app.start_service)
 
-            # Show current time as start time
-            self.last_collection_var.set("Dernière collecte: Programmée")
-            self.last_upload_var.set("Dernier téléchargement: Programmé")
-            self.last_import_var.set("Dernière importation d'utilisateur: Programmée")
+        def _done(fut):
+            try:
+                ok = fut.result()
+            except Exception as e:
+                logger.error(f"Error starting services: {e}")
+                ok = False
+            self._apply_start_result(ok)
+
+        when_done(self.root, _done, fut)
+
+    def _apply_start_result(self, ok):
+        """Reflect the outcome of start_service in the UI (must run on the Tk thread)."""
+        if ok:
+            # Gather every label, style and button change, then apply them in one pass
+            statuses, styles = self._resolve_transitions(_START_TRANSITIONS)
+            self._apply_ui_batch(
+                values=(
+                    (self.status_var, "Système en marche"),
+                    (self.last_collection_var, "Dernière collecte: Programmée"),
+                    (self.last_upload_var, "Dernier téléchargement: Programmé"),
+                    (self.last_import_var, "Dernière importation d'utilisateur: Programmée"),
+                ),
+                statuses=statuses,
+                styles=((self.status_label, _STYLE_FOR['success']),) + styles,
+                states=(
+                    (self.start_button, tk.DISABLED),
+                    (self.stop_button, tk.NORMAL),
+                )
+            )
 
             # Update system tray tooltip if available
             if self.icon:
                 self.icon.update_menu()
                 self.send_notification("Le service a été démarré")
         else:
-            messagebox.showerror("Erreur Système",
-                                 "Impossible de démarrer le système. Consultez les journaux pour plus de détails.")
+            self._apply_ui_batch(
+                values=((self.status_var, "Système arrêté"),),
+                styles=((self.status_label, _STYLE_FOR['error']),),
+                states=((self.start_button, tk.NORMAL),)
+            )
+            self._ask("Erreur Système",
+                      "Impossible de démarrer le système. Consultez les journaux pour plus de détails.")
 
     def stop_system(self):
         """Stop the attendance system."""
-        self.app.stop_service()
-
-        # Update main status
-        self.status_var.set("Système arrêté")
-        self.status_label.config(style='Error.TLabel')
-
-        # Update component statuses
-        self.update_status(self.collector_status_var, "Collecteur", "Arrêté", "error")
-        self.collector_status_label.config(style='Error.TLabel')
-
-        self.update_status(self.uploader_status_var, "Téléchargeur", "Arrêté", "error")
-        self.uploader_status_label.config(style='Error.TLabel')
-
-        self.update_status(self.user_importer_status_var, "Importateur d'Utilisateurs", "Arrêté", "error")
-        self.user_importer_status_label.config(style='Error.TLabel')
+        # Stopping joins the scheduler thread and closes the device socket, keep it off the Tk thread
+        self.status_var.set("Arrêt en cours…")
+        self._queue_ui(self.stop_button, state=tk.DISABLED)
+        fut = self._executor.submit(self.app.stop_service)
+        when_done(self.root, lambda fut: self._apply_stop_result(), fut)
+
+    def _apply_stop_result(self):
+        """Reflect the stopped services in the UI (must run on the Tk thread)."""
+        # Gather every label, style and button change, then apply them in one pass
+        statuses, styles = self._resolve_transitions(_STOP_TRANSITIONS)
+        self._apply_ui_batch(
+            values=(
+                (self.status_var, "Système arrêté"),
+            ),
+            statuses=statuses,
+            styles=((self.status_label, _STYLE_FOR['error']),) + styles,
+            states=(
+                (self.start_button, tk.NORMAL),
+                (self.stop_button, tk.DISABLED),
+            )
+        )
 
-        # Update button states
-        self.start_button.config(state=tk.NORMAL)
-        self.stop_button.config(state=tk.DISABLED)
+        # The device connection was closed, don't reuse its user list
+        self._invalidate_users_cache()
 
         # Update system tray tooltip if available
         if self.icon:
             self.icon.update_menu()
             self.send_notification("Le service a été arrêté")
 
+    def _get_users_cached(self):
+        """Return the device users, reusing the last fetch if it is recent enough."""
+        # The cache lives on the device service, so the users window and its deletions share it
+        return self._device_service.get_users_cached()
+
+    def _prewarm(self):
+        """Fetch the device user list in the background so the first window open finds it cached."""
+        # The interface modules are imported at module load; the device round-trip is the real first-click cost
+        if self.connectivity_success:
+            self._executor.submit(self._get_users_cached)
+
+    def _invalidate_users_cache(self):
+        """Force the next user list request to hit the device."""
+        self._device_service.invalidate_users_cache()
+
     def open_config(self):
         """Open the configuration window."""
-        config_window = ConfigInterface(self.root, self.app.container.get('config_repository'), self.app)
-        config_window.show()
+        # Device settings may change, so the cached user list may no longer apply
+        self._invalidate_users_cache()
+
+        if self._window_alive(self._config_win):
+            self._config_win.load_config()
+        else:
+            self._config_win = ConfigInterface(self.root, self._config_repository, self.app)
+        self._config_win.show()
 
         # After config window is closed, check if we need to update the UI
         # self.update_ui_based_on_config()
 
     def open_users(self):
         """Open the users management window."""
-        device_service = self.app.container.get('device_service')
-        users = device_service.get_users()
-        users_window = UsersInterface(
-            self.root,
-            users,
-            self.app.container.get('attendance_repository'),
-            self.app.container.get('device_service'),
-            self.app.container.get('sync_service')
-        )
-        users_window.show()
+        # Show the window right away; it reads the (usually cached) user list from the device in the background
+        if self._window_alive(self._users_win):
+            self._users_win.refresh_data()
+        else:
+            self._users_win = UsersInterface(
+                self.root,
+                None,
+                self._attendance_repository,
+                self._device_service,
+                self._sync_service
+            )
+        self._users_win.show()
 
     def open_records(self):
         """Open the records management window."""
-        # First collect the latest records
-        attendance_service = self.app.container.get('attendance_service')
-        attendance_service.collect_attendance()
-
-        # Now open the records window
-        device_service = self.app.container.get('device_service')
-        users = device_service.get_users()
-        records_window = RecordsInterface(
-            self.root,
-            users,
-            self.app.container.get('attendance_repository'),
-            self.app.container.get('attendance_service'),
-            self.app.container.get('sync_service')
-        )
-        records_window.show()
+        # Collect the latest records and fetch the user list concurrently, keeping the UI responsive
+        collect_fut = self._executor.submit(self._attendance_service.collect_attendance)
+        users_fut = self._executor.submit(self._get_users_cached)
+        progress_window = self.show_progress("Collecte des enregistrements en cours...")
+
+        def _done(collect_fut, users_fut):
+            progress_window.destroy()
+            try:
+                collect_fut.result()
+            except Exception as e:
+                logger.error(f"Error collecting attendance before opening records: {e}")
+                message = f"Erreur lors de la collecte des enregistrements: {e}"
+                self.root.after(0, lambda: messagebox.showerror("Erreur", message, parent=self.root))
+                return
+            try:
+                users = users_fut.result()
+            except Exception as e:
+                logger.error(f"Error retrieving users before opening records: {e}")
+                users = []
+            self._open_records_window(users)
+
+        when_done(self.root, _done, collect_fut, users_fut)
+
+    def _open_records_window(self, users):
+        """Build and show the records window (must run on the Tk thread)."""
+        if self._window_alive(self._records_win):
+            self._records_win.refresh(users)
+        else:
+            self._records_win = RecordsInterface(
+                self.root,
+                users,
+                self._attendance_repository,
+                self._attendance_service,
+                self._sync_service
+            )
+        self._records_win.show()
+
+    @staticmethod
+    def _window_alive(window):
+        """Check whether a cached child window can still be reused."""
+        return window is not None and bool(window.root.winfo_exists())
+
+    def show_progress(self, message):
+        """Show a small modal window with an indeterminate progress bar."""
+        progress_window = tk.Toplevel(self.root)
+        progress_window.title("Veuillez patienter")
+        progress_window.resizable(False, False)
+        progress_window.configure(background=self.COLOR_BACKGROUND)
+        progress_window.transient(self.root)
+        progress_window.protocol("WM_DELETE_WINDOW", lambda: None)  # Prevent closing
+
+        ttk.Label(progress_window, text=message, style='TLabel').pack(padx=20, pady=(15, 10))
+        progress_bar = ttk.Progressbar(progress_window, orient="horizontal", length=300, mode="indeterminate")
+        progress_bar.pack(padx=20, pady=(0, 15))
+        progress_bar.start(10)
+
+        progress_window.grab_set()
+        return progress_window
+
+    def _ask(self, title, message, on_ok=None, on_cancel=None):
+        """Show a non-blocking dialog and report the answer through callbacks.
+
+        With no on_cancel the dialog is a simple notice with a single OK button.
+        Unlike messagebox, no nested event loop is started, so scheduled work keeps running.
+        """
+        dialog = tk.Toplevel(self.root)
+        dialog.title(title)
+        dialog.resizable(False, False)
+        dialog.configure(background=self.COLOR_BACKGROUND)
+        dialog.transient(self.root)
+
+        def _answer(callback):
+            dialog.grab_release()
+            dialog.destroy()
+            if callback:
+                callback()
+
+        ttk.Label(dialog, text=message, style='TLabel', wraplength=360).pack(padx=20, pady=(15, 10))
+        buttons = ttk.Frame(dialog, style='TFrame')
+        buttons.pack(padx=20, pady=(0, 15))
+
+        if on_cancel is None:
+            ok_button = ttk.Button(buttons, text="OK", command=lambda: _answer(on_ok))
+            ok_button.pack(side=tk.LEFT, padx=5)
+            dialog.protocol("WM_DELETE_WINDOW", lambda: _answer(on_ok))
+        else:
+            ok_button = ttk.Button(buttons, text="Oui", command=lambda: _answer(on_ok))
+            ok_button.pack(side=tk.LEFT, padx=5)
+            ttk.Button(buttons, text="Non", command=lambda: _answer(on_cancel)).pack(side=tk.LEFT, padx=5)
+            dialog.protocol("WM_DELETE_WINDOW", lambda: _answer(on_cancel))
+
+        ok_button.focus_set()
+        dialog.grab_set()
+        return dialog
 
     # Add this helper method to the MainWindow class:
     def send_notification(self, message):
@@ -995,26 +1259,79 @@ class MainWindow:
     def on_close(self):
         """Handle window closing - hide window instead of exiting."""
         if not self.exit_requested:  # Regular window close, not exit request
-            # Ask if user wants to minimize to tray
-            if messagebox.askyesno("Minimiser",
-                                   "Voulez-vous minimiser l'application? Le service continuera de fonctionner en arrière-plan.",
-                                   parent=self.root):
-                self.hide_window()
-                return  # Don't proceed with closing
-            else:
-                # Ask if user wants to exit completely
-                if messagebox.askyesno("Quitter",
-                                       "Voulez-vous quitter? Cela arrêtera la collecte de présence.",
-                                       parent=self.root):
-                    # User confirmed complete exit
-                    self.exit_app()
-                else:
-                    # User canceled both options, do nothing
-                    return
+            # Ask if user wants to minimize to tray, otherwise if they want to exit completely.
+            # Canceling both options does nothing.
+            self._ask("Minimiser",
+                      "Voulez-vous minimiser l'application? Le service continuera de fonctionner en arrière-plan.",
+                      on_ok=self.hide_window,
+                      on_cancel=lambda: self._ask("Quitter",
+                                                  "Voulez-vous quitter? Cela arrêtera la collecte de présence.",
+                                                  on_ok=self._exit_in_background,
+                                                  on_cancel=lambda: None))
         else:
             # Direct exit was requested (e.g., from system tray)
             self.root.destroy()
 
+    def _exit_in_background(self):
+        """Hide the window at once and exit when services stop, or after a timeout."""
+        self.exit_requested = True
+        self.root.withdraw()
+
+        fut = self._executor.submit(self.app.stop_service) if self.app.is_running() else None
+        deadline = time.monotonic() + self.EXIT_STOP_TIMEOUT
+
+        def _check():
+            if fut is None or fut.done() or time.monotonic() > deadline:
+                if fut is not None and not fut.done():
+                    logger.warning("Services did not stop in time, exiting anyway")
+                self._finish_exit()
+            else:
+                self.root.after(100, _check)
+
+        _check()
+
+    def _setup_job_events(self):
+        """Wire scheduler job completions to the "last run" labels without busy polling."""
+        # Tk only supports file handlers on POSIX; Windows falls back to a slow queue poll
+        if os.name != 'nt' and hasattr(self.root.tk, 'createfilehandler'):
+            read_fd, write_fd = os.pipe()
+            os.set_blocking(read_fd, False)
+            self._job_event_fd = read_fd
+            self.app.add_job_listener(lambda name: os.write(write_fd, _JOB_EVENT_CODES.get(name, b'')))
+            self.root.tk.createfilehandler(read_fd, tk.READABLE, self._on_job_events)
+        else:
+            self._job_event_queue = queue.SimpleQueue()
+            self.app.add_job_listener(lambda name: self._job_event_queue.put(_JOB_EVENT_CODES.get(name, b'')))
+            self.root.after(1000, self._poll_job_events)
+
+    def _on_job_events(self, fd=None, mask=None):
+        """Drain the job event pipe and refresh the matching labels."""
+        try:
+            data = os.read(self._job_event_fd, 512)
+        except BlockingIOError:
+            return
+        self._apply_job_events(data)
+
+    def _poll_job_events(self):
+        """Drain the job event queue (platforms without Tk file handlers)."""
+        data = b''
+        while not self._job_event_queue.empty():
+            data += self._job_event_queue.get_nowait()
+        if data:
+            self._apply_job_events(data)
+        self.root.after(1000, self._poll_job_events)
+
+    def _apply_job_events(self, data):
+        """Stamp the current time on the label of each completed job."""
+        now = datetime.now().strftime("%H:%M:%S")
+        values = []
+        for code in set(data):
+            if code in _JOB_EVENT_LABELS:
+                var_name, label = _JOB_EVENT_LABELS[code]
+                values.append((getattr(self, var_name), f"{label}: {now}"))
+        if values:
+            self._apply_ui_batch(values=values)
+
     def start(self):
         """Start the main window."""
         # Check for mandatory updates before showing UI
@@ -1022,7 +1339,18 @@ class MainWindow:
             self.root.destroy()
             return
 
+        # Build the whole UI while hidden, lay it out in one pass, then show it
+        self.root.withdraw()
         self.setup_ui()
+        self._setup_job_events()
+        self.root.update_idletasks()
+        self.root.deiconify()
+
+        # Setup system tray icon once the window is up; registering it with the shell can be slow
+        self.root.after(self.TRAY_SETUP_DELAY_MS, self.setup_system_tray)
+
+        # Warm up what the first Users/Records click needs once the UI has settled
+        self.root.after(3000, self._prewarm)
 
         # Show update success notification if there was a recent update
         self.root.after(2000, lambda: self.app.show_update_success_notification(self.root))
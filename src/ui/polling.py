@@ -0,0 +1,18 @@
+# src/ui/polling.py
+POLL_MS = 50  # Interval at which work running on a worker pool is checked for completion
+
+
+def when_done(root, callback, *futures, interval: int = POLL_MS):
+    """Call callback(*futures) on the Tk thread of root once every future has resolved.
+
+    This is the single hand-off point from worker threads back to Tk, shared by every window.
+    Extra arguments are bound with functools.partial; coroutines run on an asyncio loop can
+    use it too through asyncio.run_coroutine_threadsafe.
+    """
+    def _check():
+        if all(fut.done() for fut in futures):
+            callback(*futures)
+        else:
+            root.after(interval, _check)
+
+    root.after(interval, _check)
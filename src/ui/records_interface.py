@@ -1,20 +1,142 @@
 import ast
-import os
+import json
 import sys
+import time
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
 import logging
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait
+from functools import lru_cache, partial
+from operator import attrgetter
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Set
 
 from src.domain.models import AttendanceRecord, User, ProcessedStatus, PunchType
 from src.data.repositories import AttendanceRepository
 from src.service.attendance_service import AttendanceService
 from src.service.sync_service import SyncService
+from src.ui.polling import when_done
 from src.util.error_translator import get_error_message
 
 logger = logging.getLogger(__name__)
 
+# ttk styles are global to the Tk interpreter, so they only need configuring by the first window
+_STYLES_READY = False
+
+
+def _ensure_styles_configured(palette):
+    """Configure the window's ttk styles, from the colours of palette, the first time a window needs them."""
+    global _STYLES_READY
+    if _STYLES_READY:
+        return
+    _STYLES_READY = True
+
+    style = ttk.Style()
+    style.theme_use('clam')
+
+    # Configure styles
+    style.configure('TFrame', background=palette.COLOR_BACKGROUND)
+    style.configure('Header.TFrame', background=palette.COLOR_PRIMARY)
+    style.configure('Card.TFrame', background=palette.COLOR_CARD, relief='flat', borderwidth=0)
+
+    style.configure('TLabel', background=palette.COLOR_BACKGROUND, font=('Segoe UI', 10))
+    style.configure('Card.TLabel', background=palette.COLOR_CARD, font=('Segoe UI', 10))
+    style.configure('Header.TLabel', background=palette.COLOR_PRIMARY, foreground='white',
+                    font=('Segoe UI', 12, 'bold'))
+    style.configure('Title.TLabel', background=palette.COLOR_BACKGROUND, font=('Segoe UI', 14, 'bold'))
+    style.configure('SectionTitle.TLabel', background=palette.COLOR_CARD, font=('Segoe UI', 12, 'bold'))
+
+    # Status label styles
+    style.configure('Success.TLabel', foreground=palette.COLOR_SUCCESS, background=palette.COLOR_CARD)
+    style.configure('Error.TLabel', foreground=palette.COLOR_ERROR, background=palette.COLOR_CARD)
+    style.configure('Warning.TLabel', foreground=palette.COLOR_WARNING, background=palette.COLOR_CARD)
+    style.configure('Neutral.TLabel', foreground=palette.COLOR_NEUTRAL, background=palette.COLOR_CARD)
+
+    # Button styles
+    style.configure('TButton', font=('Segoe UI', 10), padding=6)
+    style.configure('Action.TButton', padding=8)
+    style.configure('Sync.TButton', padding=10, font=('Segoe UI', 10, 'bold'))
+
+    # LabelFrame styles
+    style.configure('Card.TLabelframe', background=palette.COLOR_CARD)
+    style.configure('Card.TLabelframe.Label', background=palette.COLOR_CARD, font=('Segoe UI', 11, 'bold'))
+
+    # Treeview styles
+    style.configure('Treeview', font=('Segoe UI', 10), rowheight=palette.ROW_HEIGHT)
+    style.configure('Treeview.Heading', font=('Segoe UI', 10, 'bold'))
+
+
+@lru_cache(maxsize=256)
+def _parse_errors(errors_str: str) -> tuple:
+    """Parse a serialized error list once; JSON is tried before the slower Python literal syntax."""
+    try:
+        table = json.loads(errors_str)
+    except ValueError:
+        table = ast.literal_eval(errors_str)
+    if isinstance(table, dict):
+        table = [table]
+    return tuple(table)
+
+
+def _search_text(record) -> str:
+    """Return the lowercased text a search term is looked for in: username and timestamp.
+
+    The unit separator between them never occurs in a typed term, so no match can span both fields.
+    """
+    return f"{record.username}\x1f{record.timestamp}".lower()
+
+
+@lru_cache(maxsize=None)
+def _sort_key(column: str):
+    """Return the key sorting records by column, ties broken by id as in the repository."""
+    return attrgetter(column, 'id')
+
+
+# Status label style of each kind of status message
+_STYLE_FOR = {
+    'success': 'Success.TLabel',
+    'error': 'Error.TLabel',
+    'warning': 'Warning.TLabel',
+    'neutral': 'Neutral.TLabel',
+}
+
+# Display name of each processed status (in the treeview, errors also show their count)
+_STATUS_NAMES = {
+    ProcessedStatus.UNPROCESSED: "Non Traité",
+    ProcessedStatus.PROCESSED: "Traité",
+    ProcessedStatus.ERROR: "Erreur"
+}
+
+# Filter values that select a single status; any other value ("all") selects every record
+_VALID_STATUSES = frozenset(ProcessedStatus)
+
+# Treeview tag of each processed status; the tags carry the row colours, so rows are styled without extra work
+_STATUS_TAGS = {
+    ProcessedStatus.UNPROCESSED: "unprocessed",
+    ProcessedStatus.PROCESSED: "processed",
+    ProcessedStatus.ERROR: "error"
+}
+
+# Form combobox label of each processed status, and the reverse lookup used to parse them
+_PROCESSED_LABELS = {status: sys.intern(f"{status.value} - {name}") for status, name in _STATUS_NAMES.items()}
+_PROCESSED_FROM_LABEL = {label: status for status, label in _PROCESSED_LABELS.items()}
+
+# (field, label) pairs of the add and update record forms
+_ADD_FIELDS = (
+    ("username", "Code Employé"),
+    ("timestamp", "Horodatage (AAAA-MM-JJ HH:MM:SS)"),
+    ("punch_type", "Type de Pointage"),
+    ("processed", "Statut")
+)
+_UPDATE_FIELDS = (
+    ("username", "Code Employé"),
+    ("timestamp", "Horodatage"),
+    ("status", "Code Statut"),
+    ("punch_type", "Type de Pointage"),
+    ("processed", "Statut de Traitement")
+)
+
 
 class RecordsInterface:
     """Interface for managing attendance records."""
@@ -28,6 +150,34 @@ class RecordsInterface:
     COLOR_NEUTRAL = "#757575"  # Gray for neutral states
     COLOR_CARD = "#FFFFFF"  # White card background
 
+    # Rows are rendered lazily: a chunk at a time, when the view nears the end of what is rendered
+    RENDER_CHUNK = 100
+    ROW_HEIGHT = 25  # Treeview row height in pixels, unless the shared style says otherwise
+    OVERSCAN_ROWS = 10  # Rows rendered past the visible ones when a list is first displayed
+    RENDER_AHEAD = 0.9  # Fraction of the scroll range past which the next chunk is rendered
+    PAGE_SIZE = 200  # Records fetched from the repository per query
+    RESULT_CACHE_SIZE = 8  # Recent filter/sort/search results kept in memory
+    RESULT_CACHE_TTL = 60.0  # Seconds a cached result is reused; the device sync writes records in the background
+    REFRESH_DELAY_MS = 200  # Quiet period after typing or filter clicks before the list refreshes
+    ADD_ERROR_DEFAULTS = ("entry", "E4", "Pointages qui se chevauchent")  # Field, code, message
+    WRITE_BATCH_MS = 50  # Edits made within this delay are written in one transaction
+    ERROR_BATCH_MS = 200  # Failures reported within this delay share one error dialog
+
+    _TS_FMT = "%Y-%m-%d %H:%M:%S"  # Timestamp format of the records, as written by the device service
+    _INVALID_TIMESTAMP = "Horodatage invalide, format attendu : AAAA-MM-JJ HH:MM:SS."
+
+    # Form combobox choices, built once, and the parse maps of their display strings
+    _PUNCH_CHOICES = ("0 - Entrée", "1 - Sortie")
+    _PROCESSED_CHOICES = tuple(_PROCESSED_LABELS.values())
+    _PROCESSED_INDEX = {status: index for index, status in enumerate(_PROCESSED_LABELS)}
+    _PARSE_PUNCH = {"0 - Entrée": 0, "1 - Sortie": 1, "0": 0, "1": 1}
+
+    # Tcl lambda inserting a whole chunk of rows, so a chunk costs one call into Tcl instead of one per row
+    # Rows are passed flattened as values, tag, values, tag...
+    _INSERT_ROWS = "{tree rows} {foreach {row tag} $rows {$tree insert {} end -id [lindex $row 0] -values $row -tags $tag}}"
+    # Same for lists with their own item ids (the error list), passed flattened as iid, values, iid, values...
+    _INSERT_ITEMS = "{tree items} {foreach {iid row} $items {$tree insert {} end -id $iid -values $row}}"
+
     def __init__(
             self,
             root: Optional[tk.Tk],
@@ -50,7 +200,7 @@ class RecordsInterface:
         self.attendance_service = attendance_service
         self.sync_service = sync_service
         self.root = tk.Toplevel(root) if root else tk.Tk()
-        self.users = users or []
+        self._set_users(users)
 
         # Configure window basics
         self.root.title("Enregistrements de Présence")
@@ -60,10 +210,57 @@ class RecordsInterface:
 
         self.status_var = tk.StringVar(value="Prêt")
         self.records: List[AttendanceRecord] = []
+        self._total_records = 0  # Records matching the current query, loaded or not
+        self._query: Dict[str, Any] = {}  # Repository arguments of the current query, without paging
+        self._query_key = None  # (filter, sort, search) of the displayed records
+        self._result_cache = OrderedDict()  # query key -> (records, total, query, stored at), least recent first
+        self._stored_at = 0.0  # When the displayed records were read from the database
+        self._pending_refresh = None  # after() id of the debounced refresh, if one is scheduled
+        self._lc_source = None  # Records list the lowercase search texts below were built from
+        self._lc_texts: List[str] = []
+        self._by_id: Dict[int, AttendanceRecord] = {}  # id -> loaded record
+        self._row_cache: Dict[int, tuple] = {}  # id -> formatted treeview values
+        self._by_id_source = None  # Records list _by_id was built from
+        self._index_source = None  # Unsearched result the trigram index below was built from
+        self._inverted: Dict[str, set] = {}  # trigram -> positions in _index_source
+        self._lc_index_texts: List[str] = []  # Search text of each record of _index_source
+        self._status_source = None  # Unfiltered result the status column below was built from
+        self._status_column: List[str] = []
+        self._rendered_count = 0  # Number of records currently inserted in the tree
+        self._render_pending = False
+        self._page_load = None  # Future of the next page being read by the worker pool, if any
+        self._error_view_window: Optional[tk.Toplevel] = None  # Pooled dialogs, built on first use
+        self._error_view_title = None
+        self._error_view_tree = None
+        self._error_view_record = None
+        self._error_view_items: Dict[str, Any] = {}  # Error tree item id -> error shown by it
+        self._error_view_dirty = False  # Errors were removed from the viewed record; written once on close
+        self._add_error_window: Optional[tk.Toplevel] = None
+        self._add_error_vars = ()
+        self._add_error_record = None
+        self._add_form: Optional[tk.Toplevel] = None  # Pooled record forms, built on first use
+        self._add_form_entries: Dict[str, tk.StringVar] = {}
+        self._add_form_combos: Dict[str, ttk.Combobox] = {}
+        self._edit_form: Optional[tk.Toplevel] = None
+        self._edit_form_title = None
+        self._edit_form_entries: Dict[str, tk.StringVar] = {}
+        self._edit_form_combos: Dict[str, ttk.Combobox] = {}
+        self._edit_record = None
+        self._sync_running = False
+        self._write_queue: Dict[int, AttendanceRecord] = {}  # Edited records waiting to be written, by id
+        self._flush_after = None  # after() id of the scheduled write, if one is pending
+        self._pending_write = None  # Future of the last batch handed to the worker, until it has been written
+        self._pending_errors: List[str] = []  # Failures waiting for the next batched error dialog
+        self._last_status_style = None  # Style last applied to the status label
+        self._last_status_message = None  # Text last shown in the status bar
+        self._last_count_text = None  # Text last shown as the record count
+        self._load_seq = 0  # Incremented per load, so that only the latest background one is displayed
+        self._executor = ThreadPoolExecutor(max_workers=2)
 
         # Filter variables
         self.filter_var = tk.StringVar(value="all")  # Default to showing all records
         self.sort_var = tk.StringVar(value="timestamp")  # Default sorting
+        self._sort_desc = False  # Toggled by clicking the header of the sorted column again
         self.search_var = tk.StringVar()  # For search functionality
 
         # Record count variable
@@ -75,51 +272,23 @@ class RecordsInterface:
         # Create the UI
         self.setup_ui()
 
-        # Load records and display them
-        self.load_records()
+        # Load records in the background; the window shows up right away and fills in when they arrive
         self.display_records()
+        self._load_records_async()
+
+        # Keep child windows alive when closed so they can be reopened instantly
+        if root:
+            self.root.protocol("WM_DELETE_WINDOW", self.hide)
+            self.root.bind("<Escape>", lambda e: self.hide())
 
         # Show the window
         self.root.deiconify()
 
     def setup_style(self):
         """Configure styles for modern look."""
-        style = ttk.Style()
-        style.theme_use('clam')
-
-        # Set base colors
+        # Set base colors; the background is per window, the shared ttk styles are only configured once
         self.root.configure(background=self.COLOR_BACKGROUND)
-
-        # Configure styles
-        style.configure('TFrame', background=self.COLOR_BACKGROUND)
-        style.configure('Header.TFrame', background=self.COLOR_PRIMARY)
-        style.configure('Card.TFrame', background=self.COLOR_CARD, relief='flat', borderwidth=0)
-
-        style.configure('TLabel', background=self.COLOR_BACKGROUND, font=('Segoe UI', 10))
-        style.configure('Card.TLabel', background=self.COLOR_CARD, font=('Segoe UI', 10))
-        style.configure('Header.TLabel', background=self.COLOR_PRIMARY, foreground='white',
-                        font=('Segoe UI', 12, 'bold'))
-        style.configure('Title.TLabel', background=self.COLOR_BACKGROUND, font=('Segoe UI', 14, 'bold'))
-        style.configure('SectionTitle.TLabel', background=self.COLOR_CARD, font=('Segoe UI', 12, 'bold'))
-
-        # Status label styles
-        style.configure('Success.TLabel', foreground=self.COLOR_SUCCESS, background=self.COLOR_CARD)
-        style.configure('Error.TLabel', foreground=self.COLOR_ERROR, background=self.COLOR_CARD)
-        style.configure('Warning.TLabel', foreground=self.COLOR_WARNING, background=self.COLOR_CARD)
-        style.configure('Neutral.TLabel', foreground=self.COLOR_NEUTRAL, background=self.COLOR_CARD)
-
-        # Button styles
-        style.configure('TButton', font=('Segoe UI', 10), padding=6)
-        style.configure('Action.TButton', padding=8)
-        style.configure('Sync.TButton', padding=10, font=('Segoe UI', 10, 'bold'))
-
-        # LabelFrame styles
-        style.configure('Card.TLabelframe', background=self.COLOR_CARD)
-        style.configure('Card.TLabelframe.Label', background=self.COLOR_CARD, font=('Segoe UI', 11, 'bold'))
-
-        # Treeview styles
-        style.configure('Treeview', font=('Segoe UI', 10), rowheight=25)
-        style.configure('Treeview.Heading', font=('Segoe UI', 10, 'bold'))
+        _ensure_styles_configured(self)
 
     def setup_ui(self):
         """Set up the modern user interface."""
@@ -239,6 +408,9 @@ class RecordsInterface:
         search_entry.pack(side=tk.LEFT, padx=5, fill=tk.X, expand=True)
         search_entry.bind("<Return>", lambda e: self.apply_filter())
 
+        # Filter live while typing, once the user pauses
+        self.search_var.trace_add('write', lambda *_: self._schedule_refresh())
+
         button_frame = ttk.Frame(basic_tab, style='Card.TFrame')
         button_frame.pack(fill=tk.X, pady=10)
 
@@ -258,13 +430,14 @@ class RecordsInterface:
         status_buttons = ttk.Frame(status_frame, style='Card.TFrame', padding=5)
         status_buttons.pack(fill=tk.X)
 
-        ttk.Radiobutton(status_buttons, text="Tous", variable=self.filter_var, value="all").pack(side=tk.LEFT, padx=10)
+        ttk.Radiobutton(status_buttons, text="Tous", variable=self.filter_var, value="all",
+                        command=self._schedule_refresh).pack(side=tk.LEFT, padx=10)
         ttk.Radiobutton(status_buttons, text="Traités", variable=self.filter_var,
-                        value=ProcessedStatus.PROCESSED).pack(side=tk.LEFT, padx=10)
+                        value=ProcessedStatus.PROCESSED, command=self._schedule_refresh).pack(side=tk.LEFT, padx=10)
         ttk.Radiobutton(status_buttons, text="Non Traités", variable=self.filter_var,
-                        value=ProcessedStatus.UNPROCESSED).pack(side=tk.LEFT, padx=10)
+                        value=ProcessedStatus.UNPROCESSED, command=self._schedule_refresh).pack(side=tk.LEFT, padx=10)
         ttk.Radiobutton(status_buttons, text="Erreur", variable=self.filter_var,
-                        value=ProcessedStatus.ERROR).pack(side=tk.LEFT, padx=10)
+                        value=ProcessedStatus.ERROR, command=self._schedule_refresh).pack(side=tk.LEFT, padx=10)
 
         # Sort options section  
         sort_frame = ttk.LabelFrame(advanced_tab, text="Tri", style='Card.TLabelframe')
@@ -277,25 +450,60 @@ class RecordsInterface:
         sort_combo = ttk.Combobox(sort_content, textvariable=self.sort_var, width=15,
                                   values=["timestamp", "username", "id", "punch_type"])
         sort_combo.pack(side=tk.LEFT, padx=5)
+        sort_combo.bind("<<ComboboxSelected>>", self._on_sort_selected)
 
         # Apply filter button
         ttk.Button(advanced_tab, text="Appliquer les Filtres", command=self.apply_filter,
                    style='Action.TButton').pack(pady=10, fill=tk.X)
 
-    def resource_path(self, relative_path):
-        """Get absolute path to resource, works for dev and for PyInstaller."""
-        try:
-            # PyInstaller creates a temp folder and stores path in _MEIPASS
-            base_path = sys._MEIPASS
-        except AttributeError:
-            base_path = os.path.abspath(".")
-
-        return os.path.join(base_path, relative_path)
-
     def create_records_card(self, parent):
         """Create the card containing the records table."""
         self.records_frame = self.create_card(parent, "Liste des Enregistrements")
-        # The actual treeview will be created in display_records()
+
+        # Create a frame for the treeview and scrollbars
+        tree_container = ttk.Frame(self.records_frame, style='Card.TFrame')
+        tree_container.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+
+        # Create the Treeview
+        self._style = ttk.Style(self.root)
+        columns = ("id", "username", "timestamp", "punch_type", "processed")
+        self.tree = ttk.Treeview(tree_container, columns=columns, show="headings", selectmode="extended")
+
+        # Define headings
+        self.tree.heading("id", text="ID", command=lambda: self.sort_treeview("id"))
+        self.tree.heading("username", text="Code Employé", command=lambda: self.sort_treeview("username"))
+        self.tree.heading("timestamp", text="Horodatage", command=lambda: self.sort_treeview("timestamp"))
+        self.tree.heading("punch_type", text="Type de Pointage", command=lambda: self.sort_treeview("punch_type"))
+        self.tree.heading("processed", text="Statut", command=lambda: self.sort_treeview("processed"))
+
+        # Define columns
+        self.tree.column("id", width=50, anchor=tk.CENTER)
+        self.tree.column("username", width=150, anchor=tk.CENTER)
+        self.tree.column("timestamp", width=220, anchor=tk.CENTER)
+        self.tree.column("punch_type", width=120, anchor=tk.CENTER)
+        self.tree.column("processed", width=120, anchor=tk.CENTER)
+
+        # Status colours; unprocessed rows keep the default text colour
+        self.tree.tag_configure("processed", foreground=self.COLOR_SUCCESS)
+        self.tree.tag_configure("error", foreground=self.COLOR_ERROR)
+
+        # Add scrollbars
+        v_scrollbar = ttk.Scrollbar(tree_container, orient=tk.VERTICAL, command=self.tree.yview)
+        v_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        h_scrollbar = ttk.Scrollbar(tree_container, orient=tk.HORIZONTAL, command=self.tree.xview)
+        h_scrollbar.pack(side=tk.BOTTOM, fill=tk.X)
+
+        # Registered once, so that detaching and restoring it around bulk inserts creates no new Tcl command
+        self._v_scrollbar = v_scrollbar
+        self._yscroll_command = self.tree.register(self._on_tree_yscroll)
+        self.tree.configure(yscrollcommand=self._yscroll_command, xscrollcommand=h_scrollbar.set)
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        # Right-click menu, built on first use; most sessions never open it
+        self.context_menu = None
+        self.tree.bind("<Button-3>", self.show_context_menu)
+        self.tree.bind("<Double-1>", self.on_double_click)
 
     def create_action_panel(self, parent):
         """Create the panel with action buttons using a modern layout."""
@@ -368,143 +576,680 @@ class RecordsInterface:
 
     def show(self):
         """Display the records window as a modal dialog."""
+        self.root.deiconify()
+        self.root.lift()
         self.root.grab_set()
         self.root.transient(self.root.master)
         self.root.focus_set()
 
-    def load_records(self):
-        """Load attendance records based on current filter."""
+    def hide(self):
+        """Hide the window so it can be reopened without being rebuilt."""
+        self._flush_writes()
+        # A refresh still waiting on the typing delay would query for a hidden list; reopening reloads anyway
+        if self._pending_refresh:
+            self.root.after_cancel(self._pending_refresh)
+            self._pending_refresh = None
+        self.root.grab_release()
+        self.root.withdraw()
+
+    def refresh(self, users: Optional[List[User]] = None):
+        """Reload the records of an existing window."""
+        if users is not None:
+            self._set_users(users)
+        self._load_records_async()
+
+    def _set_users(self, users: Optional[List[User]]):
+        """Store the known users, indexed by name for the add form's user id lookup."""
+        self.users = users or []
+        self._users_by_name: Dict[str, User] = {u.name: u for u in self.users}
+
+    def _resolve_user_id(self, username: str) -> int:
+        """Return the user id of a known username, 0 when the user is unknown."""
+        user = self._users_by_name.get(username)
+        return user.user_id if user else 0
+
+    def _current_query_key(self):
+        """Return the (filter, sort, search) inputs that determine the loaded records.
+
+        The sort is the column name, prefixed with '-' when descending.
+        """
+        sort = ('-' if self._sort_desc else '') + self.sort_var.get()
+        return self.filter_var.get(), sort, self.search_var.get().strip()
+
+    def load_records(self, keep_cache: bool = False):
+        """Load attendance records based on current filter.
+
+        Unless keep_cache is set, cached results are dropped first, since callers reload after changing data.
+        """
+        if not self._begin_load(keep_cache):
+            return
+
+        key = self._current_query_key()
+        query = self._build_query(key)
         try:
-            if not self.attendance_repository:
-                self.status_var.set("Référentiel d'enregistrements non disponible")
-                self.status_label.config(style='Error.TLabel')
-                return
+            records, total = self._fetch_records(query, self._pending_write)
+        except Exception as e:
+            self._load_failed(e)
+        else:
+            self._store_loaded(key, query, records, total)
 
-            filter_value = self.filter_var.get()
-            order_by = self.sort_var.get()
-            search_term = self.search_var.get()
-
-            # Convert filter value to the appropriate parameter
-            filter_processed = None  # Default to all records
-            if filter_value == ProcessedStatus.PROCESSED:
-                filter_processed = ProcessedStatus.PROCESSED
-            elif filter_value == ProcessedStatus.UNPROCESSED:
-                filter_processed = ProcessedStatus.UNPROCESSED
-            elif filter_value == ProcessedStatus.ERROR:
-                filter_processed = ProcessedStatus.ERROR
-
-            # Get records from repository
-            self.records = self.attendance_repository.get_records(
-                processed_status=filter_processed,
-                order_by=order_by
-            )
-
-            # Apply search filter if provided
-            if search_term:
-                search_term = search_term.lower()
-                self.records = [
-                    r for r in self.records if
-                    search_term in str(r.username).lower() or
-                    search_term in str(r.timestamp).lower()
-                ]
-
-            # Update record count
-            if not self.records:
-                logger.info(f"No {filter_value} attendance records found.")
-                self.record_count_var.set("0 enregistrements trouvés")
-                self.status_var.set("Aucun enregistrement trouvé")
-                self.status_label.config(style='Warning.TLabel')
-            else:
-                self.record_count_var.set(f"{len(self.records)} enregistrements")
-                self.status_var.set(f"{len(self.records)} enregistrements chargés")
-                self.status_label.config(style='Success.TLabel')
-                logger.info(f"Loaded {len(self.records)} {filter_value} attendance records.")
+    def _load_records_async(self, keep_cache: bool = False):
+        """Load the records of the current query on a worker thread and display them when they arrive."""
+        if not self._begin_load(keep_cache):
+            self.display_records()
+            return
 
+        key = self._current_query_key()
+        query = self._build_query(key)
+        seq = self._load_seq
+        self._set_status("Chargement des enregistrements…", 'warning')
+        fut = self._executor.submit(self._fetch_records, query, self._pending_write)
+        when_done(self.root, partial(self._on_records_loaded, seq, key, query), fut)
+
+    def _on_records_loaded(self, seq, key, query, fut):
+        """Display the result of a background load, unless a newer load has started since."""
+        if seq != self._load_seq or not self.root.winfo_exists():
+            return
+        try:
+            records, total = fut.result()
         except Exception as e:
-            self.handle_error("Erreur lors du chargement des enregistrements", e)
-            self.records = []
-            self.record_count_var.set("Erreur de chargement")
+            self._load_failed(e)
+        else:
+            self._store_loaded(key, query, records, total)
+        self.display_records()
 
-    def display_records(self):
-        """Display the attendance records in the treeview."""
-        # Clear previous records display
-        for widget in self.records_frame.winfo_children():
-            widget.destroy()
+    def _begin_load(self, keep_cache: bool) -> bool:
+        """Reset the state a reload replaces; return False when there is nothing to load from."""
+        self._flush_writes()  # The reload must see the pending edits
+        self._load_seq += 1  # Any background load still running is now stale
+        if not keep_cache:
+            self._result_cache.clear()
+            self._index_source, self._inverted = None, {}
+        self._query_key = None
 
-        # Create a frame for the treeview and scrollbars
-        tree_container = ttk.Frame(self.records_frame, style='Card.TFrame')
-        tree_container.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        # Records are about to be re-read, and background jobs may have changed them since they were formatted
+        self._row_cache.clear()
 
-        # Create the Treeview
-        columns = ("id", "username", "timestamp", "punch_type", "processed")
-        self.tree = ttk.Treeview(tree_container, columns=columns, show="headings", selectmode="extended")
+        if not self.attendance_repository:
+            self._set_status("Référentiel d'enregistrements non disponible", 'error')
+            return False
+        return True
+
+    @staticmethod
+    def _build_query(key) -> Dict[str, Any]:
+        """Return the repository arguments, without paging, of a (filter, sort, search) key."""
+        filter_value, sort, search_term = key
+
+        # The radio buttons store the status value itself; anything else means all records
+        filter_processed = filter_value if filter_value in _VALID_STATUSES else None
+
+        return {
+            'processed_status': filter_processed,
+            'order_by': sort.lstrip('-'),
+            'descending': sort.startswith('-'),
+            'search': search_term or None
+        }
 
-        # Define headings
-        self.tree.heading("id", text="ID", command=lambda: self.sort_treeview("id"))
-        self.tree.heading("username", text="Code Employé", command=lambda: self.sort_treeview("username"))
-        self.tree.heading("timestamp", text="Horodatage", command=lambda: self.sort_treeview("timestamp"))
-        self.tree.heading("punch_type", text="Type de Pointage", command=lambda: self.sort_treeview("punch_type"))
-        self.tree.heading("processed", text="Statut", command=lambda: self.sort_treeview("processed"))
+    def _fetch_records(self, query: Dict[str, Any], after_write=None):
+        """Return the first page and the total count of a query. Touches no widget, so it can run on a worker."""
+        if after_write is not None:
+            wait((after_write,))  # The edits queued before this load must be in the database first
 
-        # Define columns
-        self.tree.column("id", width=50, anchor=tk.CENTER)
-        self.tree.column("username", width=150, anchor=tk.CENTER)
-        self.tree.column("timestamp", width=220, anchor=tk.CENTER)
-        self.tree.column("punch_type", width=120, anchor=tk.CENTER)
-        self.tree.column("processed", width=120, anchor=tk.CENTER)
+        # Filtering and search run in the database; only the first page is fetched here,
+        # the following ones are loaded as the list is scrolled
+        total = self.attendance_repository.count_records(
+            processed_status=query['processed_status'],
+            search=query['search']
+        )
+        records = self.attendance_repository.get_records(**query, limit=self.PAGE_SIZE, offset=0)
+        self._parse_loaded_errors(records)
+        return records, total
 
-        # Add scrollbars
-        v_scrollbar = ttk.Scrollbar(tree_container, orient=tk.VERTICAL, command=self.tree.yview)
-        v_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+    def _store_loaded(self, key, query, records, total):
+        """Make a freshly fetched result the current one."""
+        self._query = query
+        self.records = records
+        self._total_records = total
 
-        h_scrollbar = ttk.Scrollbar(tree_container, orient=tk.HORIZONTAL, command=self.tree.xview)
-        h_scrollbar.pack(side=tk.BOTTOM, fill=tk.X)
+        # Remember the result; later pages extend the same list in place
+        self._query_key = key
+        self._stored_at = time.monotonic()
+        self._cache_result(key, records, total, query, self._stored_at)
 
-        self.tree.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
-        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self._update_record_count()
 
-        # Insert records into the Treeview
-        for record in self.records:
-            # Format punch type display
-            punch_text = "Entrée" if record.punch_type == PunchType.IN else "Sortie"
-
-            # Format processed status display
-            if record.processed == ProcessedStatus.PROCESSED:
-                processed_text = "Traité"
-            elif record.processed == ProcessedStatus.UNPROCESSED:
-                processed_text = "Non Traité"
-            elif record.processed == ProcessedStatus.ERROR:
-                error_count = len(record.errors) if hasattr(record, 'errors') and record.errors else 0
-                processed_text = f"Erreur ({error_count})" if error_count else "Erreur"
-            else:
-                processed_text = "Inconnu"
+    def _cache_result(self, key, records, total, query, stored_at: float):
+        """Store a result in the LRU result cache, evicting the least recently used ones.
 
-            self.tree.insert("", tk.END, values=(
-                record.id,
-                record.username,
-                record.timestamp if record.timestamp else "N/A",
-                punch_text,
-                processed_text
-            ))
+        stored_at is when the records were read from the database; results computed in memory
+        keep the time of their source so they expire with it.
+        """
+        self._result_cache[key] = (records, total, query, stored_at)
+        self._result_cache.move_to_end(key)
+        while len(self._result_cache) > self.RESULT_CACHE_SIZE:
+            self._result_cache.popitem(last=False)
+
+    def _cached_result(self, key):
+        """Return the cached (records, total, query, stored at) for key, or None when absent or older than RESULT_CACHE_TTL."""
+        cached = self._result_cache.get(key)
+        if cached is None:
+            return None
+        if time.monotonic() - cached[3] > self.RESULT_CACHE_TTL:
+            del self._result_cache[key]  # Records may have been synced since; read them again
+            return None
+        return cached
+
+    def _load_failed(self, error: Exception):
+        """Show an empty list after a failed load."""
+        self.handle_error("Erreur lors du chargement des enregistrements", error)
+        self.records = []
+        self._total_records = 0
+        self._set_record_count("Erreur de chargement")
+
+    def _find_record(self, record_id: int) -> Optional[AttendanceRecord]:
+        """Return a loaded record by id, rebuilding the id map when the loaded records changed."""
+        # Paging extends the list in place, so compare the length as well as the identity
+        if self._by_id_source is not self.records or len(self._by_id) != len(self.records):
+            self._by_id = {r.id: r for r in self.records}
+            self._by_id_source = self.records
+        return self._by_id.get(record_id)
+
+    def _update_record_count(self):
+        """Show the number of records matching the current query."""
+        filter_value = self.filter_var.get()
+        if not self.records:
+            logger.info(f"No {filter_value} attendance records found.")
+            self._set_record_count("0 enregistrements trouvés")
+            self._set_status("Aucun enregistrement trouvé", 'warning')
+        else:
+            self._set_record_count(f"{self._total_records} enregistrements")
+            self._set_status(f"{self._total_records} enregistrements chargés", 'success')
+            logger.info(f"Loaded {len(self.records)} of {self._total_records} {filter_value} attendance records.")
+
+    def _set_record_count(self, text: str):
+        """Show the record count, writing the variable only when the text changes (re-sorts keep the count)."""
+        if text != self._last_count_text:
+            self.record_count_var.set(text)
+            self._last_count_text = text
+
+    def _load_next_page(self):
+        """Read the next page of the current query on the worker pool; its rows are rendered when it arrives."""
+        if self._page_load is not None or not self.records:
+            return  # Already on its way, or no record to page after
+        self._flush_writes()  # The page must see the pending edits
+        after = self._page_key()
+        fut = self._executor.submit(self._fetch_page, self._query, after, self._pending_write)
+        self._page_load = fut
+        when_done(self.root, partial(self._on_page_loaded, self.records, after), fut)
+
+    def _page_key(self):
+        """Return the (sort value, id) of the last loaded record, which the next page starts after."""
+        last = self.records[-1]
+        return getattr(last, self._query.get('order_by', 'timestamp')), last.id
+
+    def _fetch_page(self, query: Dict[str, Any], after, after_write=None) -> List[AttendanceRecord]:
+        """Return the page of a query following the after key. Touches no widget, so it can run on a worker."""
+        if after_write is not None:
+            wait((after_write,))
+        # Paging on the last key rather than an offset: the scheduler's jobs add and re-mark records between
+        # scrolls, which would shift an offset and skip rows or read loaded ones again
+        page = self.attendance_repository.get_records(**query, limit=self.PAGE_SIZE, after=after)
+        self._parse_loaded_errors(page)
+        return page
+
+    def _on_page_loaded(self, records, after, fut):
+        """Append a page read by _load_next_page and render the rows waiting for it."""
+        if fut is not self._page_load:
+            return  # A new result replaced the one the page was read for
+        self._page_load = None
+        if records is not self.records or not records or self._page_key() != after \
+                or not self.root.winfo_exists():
+            return  # The last loaded record changed meanwhile; the next scroll reads the page after the new one
+        try:
+            page = fut.result()
+        except Exception as e:
+            logger.error(f"Error loading more attendance records: {e}")
+            page = []
+
+        # A record patched in while the page was read must not get a second tree item
+        page = [r for r in page if self._find_record(r.id) is None]
+
+        # Nothing more to read (or the table shrank since the count), stop asking
+        if not page:
+            self._total_records = len(self.records)
+        self.records.extend(page)
+        # Keep an up-to-date id map current with the page, rather than rebuilding it from every loaded record
+        if self._by_id_source is self.records:
+            self._by_id.update((r.id, r) for r in page)
+        self._render_more_rows()
+
+    def _parse_loaded_errors(self, records: List[AttendanceRecord]):
+        """Replace errors still in string form by their parsed list, so rendering and viewing never parse."""
+        for record in records:
+            if isinstance(record.errors, str):
+                record.errors = self.convert_error_string_to_table(record.errors)
 
-        # Add right-click menu
-        self.create_context_menu()
+    def display_records(self):
+        """Display the attendance records in the treeview."""
+        # The treeview is built once; only its items are replaced
+        self.tree.delete(*self.tree.get_children())
+        self.tree.yview_moveto(0)
+        self._page_load = None  # A page still being read belongs to the previous result
+
+        # Only the rows filling the viewport are inserted now, the rest follow as the user scrolls;
+        # before the tree is mapped its height is unknown, so a regular chunk is used
+        self._rendered_count = 0
+        visible = self.tree.winfo_height() // self._row_height()
+        self._render_more_rows(visible + self.OVERSCAN_ROWS if visible > 1 else None)
+
+    def _row_height(self) -> int:
+        """Return the current Treeview row height; styles are shared, so another window may have changed it."""
+        try:
+            return int(self._style.lookup('Treeview', 'rowheight')) or self.ROW_HEIGHT
+        except (tk.TclError, ValueError):
+            return self.ROW_HEIGHT
+
+    def _on_tree_yscroll(self, first, last):
+        """Update the scrollbar and schedule more rows when the view nears the last rendered one."""
+        self._v_scrollbar.set(first, last)
+        if float(last) >= self.RENDER_AHEAD and not self._render_pending \
+                and self._rendered_count < max(len(self.records), self._total_records):
+            self._render_pending = True
+            self.root.after_idle(self._render_more_rows)
+
+    def _render_more_rows(self, count: Optional[int] = None):
+        """Insert the next chunk of records (RENDER_CHUNK unless count is given) into the treeview."""
+        self._render_pending = False
+        count = count or self.RENDER_CHUNK
+        start = self._rendered_count
+        chunk = self.records[start:start + count]
+        self._rendered_count = start + len(chunk)
+
+        # Rows past the loaded ones need the next page, which is read off the Tk thread and rendered on arrival
+        if start + count > len(self.records) and len(self.records) < self._total_records:
+            self._load_next_page()
+        if not chunk:
+            return
+
+        # Format the whole chunk first so the insert loop below only talks to Tk;
+        # attribute chains are bound to locals once instead of looked up per record
+        cached, format_row, tag_for = self._row_cache.get, self._format_row, _STATUS_TAGS.get
+        rows = []
+        for record in chunk:
+            rows += (cached(record.id) or format_row(record), tag_for(record.processed, ""))
+
+        # Insert the chunk into the Treeview with a single Tcl call, skipping the option munging of Treeview.insert;
+        # the record id is the item id, so single rows can be updated in place after an edit
+        # The scroll command is detached meanwhile so the scrollbar is updated once, not per row;
+        # it is restored even if the insert fails, or no further chunk would ever be rendered
+        tk_call, tree = self.tree.tk.call, self.tree._w
+        tk_call(tree, 'configure', '-yscrollcommand', '')
+        try:
+            tk_call('apply', self._INSERT_ROWS, tree, tuple(rows))
+        finally:
+            tk_call(tree, 'configure', '-yscrollcommand', self._yscroll_command)
+
+    def _format_row(self, record: AttendanceRecord) -> tuple:
+        """Return the treeview values of a record, formatting it only once per loaded version."""
+        row = self._row_cache.get(record.id)
+        if row is not None:
+            return row
+
+        # Format punch type display
+        punch_text = "Entrée" if record.punch_type == PunchType.IN else "Sortie"
+
+        # Format processed status display
+        processed = record.processed
+        if processed == ProcessedStatus.ERROR:
+            error_count = len(record.errors) if record.errors else 0  # Parsed to a list when loaded
+            processed_text = f"Erreur ({error_count})" if error_count else "Erreur"
+        else:
+            processed_text = _STATUS_NAMES.get(processed, "Inconnu")
+
+        row = (
+            record.id,
+            record.username,
+            record.timestamp if record.timestamp else "N/A",
+            punch_text,
+            processed_text
+        )
+        self._row_cache[record.id] = row
+        return row
+
+    def _matches_query(self, record: AttendanceRecord) -> bool:
+        """Check whether a record belongs to the displayed result, as the repository filter would."""
+        status = self._query.get('processed_status')
+        if status and record.processed != status:
+            return False
+        term = (self._query.get('search') or '').lower()
+        return not term or term in _search_text(record)
+
+    def _enqueue_update(self, record: AttendanceRecord):
+        """Queue a record for writing; edits made in quick succession are saved in one transaction."""
+        self._write_queue[record.id] = record
+        if self._flush_after is None:
+            self._flush_after = self.root.after(self.WRITE_BATCH_MS, self._flush_writes)
+
+    def _flush_writes(self):
+        """Hand the queued records to the worker pool for writing."""
+        if self._flush_after is not None:
+            self.root.after_cancel(self._flush_after)
+            self._flush_after = None
+        if not self._write_queue:
+            return
+        records = list(self._write_queue.values())
+        self._write_queue.clear()
+
+        # Each batch waits for the previous one, so edits reach the database in the order they were made
+        fut = self._executor.submit(self._write_records, records, self._pending_write)
+        self._pending_write = fut
+        when_done(self.root, self._on_records_written, fut)
+
+    def _write_records(self, records: List[AttendanceRecord], previous_write=None):
+        """Write a batch of records in one transaction. Touches no widget, so it can run on a worker."""
+        if previous_write is not None:
+            wait((previous_write,))
+        self.attendance_repository.update_records(records)
+
+    def _on_records_written(self, fut):
+        """Report a failed background write."""
+        if fut is self._pending_write:
+            self._pending_write = None
+        error = fut.exception()
+        if error is not None:
+            self.handle_error("Erreur lors de l'enregistrement des modifications", error)
+
+    def _chain_write(self, func, *args):
+        """Run a repository write on the worker pool after the pending ones; later reads and writes wait for it."""
+        self._flush_writes()
+        fut = self._executor.submit(self._run_after, self._pending_write, func, *args)
+        self._pending_write = fut
+        return fut
+
+    @staticmethod
+    def _run_after(previous, func, *args):
+        """Call func(*args) once the previous future has resolved. Runs on a worker."""
+        if previous is not None:
+            wait((previous,))
+        return func(*args)
+
+    def _upsert_tree_row(self, record: AttendanceRecord):
+        """Show an edited or added record in place, without reloading and redrawing the whole list."""
+        self._upsert_tree_rows((record,))
+
+    def _upsert_tree_rows(self, records: List[AttendanceRecord]):
+        """Show edited or added records in place, updating the in-memory state once for the whole batch."""
+        edited_out, edited, added = set(), [], []
+        for record in records:
+            self._row_cache.pop(record.id, None)
+            iid = str(record.id)
+            loaded = self._find_record(record.id)
+            if not self._matches_query(record):
+                if loaded:
+                    edited_out.add(record.id)  # Edited out of the displayed result
+            elif loaded is None:
+                added.append(record)
+            else:
+                edited.append(record)
+                if self.tree.exists(iid):
+                    self.tree.item(iid, values=self._format_row(record),
+                                   tags=(_STATUS_TAGS.get(record.processed, ""),))
+        self._total_records -= self._drop_rows(edited_out)
+
+        try:
+            self._place_sorted(edited, added)
+        except TypeError:
+            # Missing values do not compare in Python; let the database order them
+            self._load_records_async()
+            return
+        self._results_changed()
+
+    def _place_sorted(self, edited: List[AttendanceRecord], added: List[AttendanceRecord]):
+        """Move edited records whose sort value changed, and insert added ones, at their place in the current sort."""
+        key = _sort_key(self._query.get('order_by', 'timestamp'))
+        descending = self._query.get('descending', False)
+        records = self.records
+        incomplete = len(records) < self._total_records  # Pages remain to be loaded after these records
+
+        def precedes(a, b):
+            return a > b if descending else a < b
+
+        # Only the edited records that now compare wrongly with a neighbour have to move
+        edited_ids = {r.id for r in edited}
+        misplaced = []
+        for i in (i for i, r in enumerate(records) if r.id in edited_ids):
+            value = key(records[i])
+            if (i > 0 and precedes(value, key(records[i - 1]))) \
+                    or (i + 1 < len(records) and precedes(key(records[i + 1]), value)):
+                misplaced.append(records[i])
+        self._drop_rows({r.id for r in misplaced})
+
+        self._total_records += len(added)
+        for record in misplaced + added:
+            index = self._sorted_index(record, key, descending)
+            if index == len(self.records) and incomplete:
+                continue  # Sorts after the loaded pages; it comes with the page it falls in
+            self._insert_loaded(record, index)
+
+    def _sorted_index(self, record: AttendanceRecord, key, descending: bool) -> int:
+        """Return the position of record among the loaded records, which are sorted by key."""
+        target, records = key(record), self.records
+        lo, hi = 0, len(records)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            value = key(records[mid])
+            if (target < value) if descending else (value < target):
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _insert_loaded(self, record: AttendanceRecord, index: int):
+        """Insert a record into the loaded ones, and into the tree when that part of the list is rendered."""
+        all_rendered = self._rendered_count >= len(self.records)
+        self.records.insert(index, record)
+        self._by_id[record.id] = record
+        if index < self._rendered_count or all_rendered:
+            self._rendered_count += 1
+            self.tree.insert("", index, iid=str(record.id), values=self._format_row(record),
+                             tags=(_STATUS_TAGS.get(record.processed, ""),))
+
+    def _delete_tree_row(self, record_id: int):
+        """Remove a record from the displayed result and the treeview."""
+        self._delete_tree_rows({record_id})
+
+    def _delete_tree_rows(self, record_ids: Set[int]):
+        """Remove records from the displayed result and the treeview in one pass."""
+        removed = self._drop_rows(record_ids)
+        if removed:
+            self._total_records -= removed
+            for record_id in record_ids:
+                self._row_cache.pop(record_id, None)
+            self._results_changed()
+
+    def _drop_rows(self, record_ids: Set[int]) -> int:
+        """Remove the loaded records with the given ids and their tree items; return how many were loaded."""
+        if not record_ids:
+            return 0
+        rendered = [str(r.id) for r in self.records[:self._rendered_count] if r.id in record_ids]
+        kept = [r for r in self.records if r.id not in record_ids]
+        removed = len(self.records) - len(kept)
+        if not removed:
+            return 0
+
+        # Rebuilt in place: cached results and the id map refer to this list
+        self.records[:] = kept
+        for record_id in record_ids:
+            self._by_id.pop(record_id, None)
+        self._rendered_count -= len(rendered)
+        if rendered:
+            self.tree.delete(*rendered)
+        return removed
+
+    def _results_changed(self):
+        """Keep the in-memory state consistent after the displayed result was patched in place."""
+        self._lc_source = self._status_source = None  # The id map is patched by the callers, columns are rebuilt
+
+        # Other cached results may hold stale copies of the edited records; only the patched one stays
+        self._result_cache.clear()
+        self._index_source, self._inverted = None, {}
+        if self._query_key is not None:
+            # Patching does not make the rest of the result any fresher
+            self._cache_result(self._query_key, self.records, self._total_records, self._query, self._stored_at)
+        self._update_record_count()
 
     def reset_search(self):
         """Reset search field and reload records."""
         self.search_var.set("")
         self.apply_filter()
 
+    def _schedule_refresh(self):
+        """Refresh the list once the filter inputs have been quiet for REFRESH_DELAY_MS."""
+        if self._pending_refresh:
+            self.root.after_cancel(self._pending_refresh)
+        self._pending_refresh = self.root.after(self.REFRESH_DELAY_MS, self.apply_filter)
+
     def apply_filter(self):
         """Apply the selected filter and sort options."""
-        self.load_records()
+        # An explicit apply supersedes any debounced one
+        if self._pending_refresh:
+            self.root.after_cancel(self._pending_refresh)
+            self._pending_refresh = None
+
+        key = self._current_query_key()
+        if key == self._query_key:
+            return  # Already displaying this exact result
+
+        cached = self._cached_result(key)
+        if cached:
+            self._result_cache.move_to_end(key)
+            self.records, self._total_records, self._query, self._stored_at = cached
+            self._query_key = key
+            self._update_record_count()
+        elif not self._narrow_loaded_search(key) and not self._search_base_result(key) \
+                and not self._sort_loaded_result(key) and not self._filter_base_result(key):
+            self._load_records_async(keep_cache=True)
+            return  # Displayed once loaded
         self.display_records()
 
+    def _narrow_loaded_search(self, key) -> bool:
+        """Filter the loaded records in memory when the new search only narrows the current one.
+
+        Typing more characters can only remove matches, so once every record of the current
+        result is loaded there is no need to ask the database again.
+        """
+        if not self._query_key or not key[2] or len(self.records) < self._total_records:
+            return False
+        filter_value, order_by, previous_term = self._query_key
+        term = key[2].lower()
+        if key[:2] != (filter_value, order_by) or previous_term.lower() not in term:
+            return False
+
+        # Search texts are built once per loaded result and reused for every narrowing keystroke
+        if self._lc_source is not self.records:
+            self._lc_texts = [_search_text(r) for r in self.records]
+
+        records = self.records
+        matches = [i for i, text in enumerate(self._lc_texts) if term in text]
+        self.records = [records[i] for i in matches]
+        self._lc_texts = [self._lc_texts[i] for i in matches]
+        self._lc_source = self.records
+
+        self._use_in_memory_result(key)
+        return True
+
+    def _search_base_result(self, key) -> bool:
+        """Answer a search from the cached unsearched result of the same filter and sort, if fully loaded."""
+        term = key[2].lower()
+        cached = self._cached_result((key[0], key[1], ''))
+        if not term or not cached or len(cached[0]) < cached[1]:
+            return False
+
+        records = cached[0]
+        if self._index_source is not records:
+            self._build_search_index(records)
+        texts = self._lc_index_texts
+
+        # Every record containing the term contains all of its trigrams, so intersecting
+        # their postings gives the candidates; shorter terms fall back to a full scan
+        if len(term) >= 3:
+            postings = sorted((self._inverted.get(term[i:i + 3], set()) for i in range(len(term) - 2)), key=len)
+            candidates = sorted(set.intersection(*postings))
+        else:
+            candidates = range(len(records))
+
+        matches = [i for i in candidates if term in texts[i]]
+        self.records = [records[i] for i in matches]
+        self._lc_texts = [texts[i] for i in matches]
+        self._lc_source = self.records
+        self._query, self._stored_at = cached[2:]
+        self._use_in_memory_result(key)
+        return True
+
+    def _build_search_index(self, records):
+        """Index the search text of each record by trigram."""
+        self._lc_index_texts = [_search_text(r) for r in records]
+        inverted: Dict[str, set] = {}
+        # Trigrams spanning the separator are indexed too, but no typed term ever looks them up
+        for i, text in enumerate(self._lc_index_texts):
+            for j in range(len(text) - 2):
+                inverted.setdefault(text[j:j + 3], set()).add(i)
+        self._inverted = inverted
+        self._index_source = records
+
+    def _use_in_memory_result(self, key):
+        """Make the records computed in memory for key the current, cached result."""
+        self._total_records = len(self.records)
+        self._query = dict(self._query, search=key[2])
+        self._query_key = key
+        self._cache_result(key, self.records, self._total_records, self._query, self._stored_at)
+        self._update_record_count()
+
+    def _sort_loaded_result(self, key) -> bool:
+        """Re-sort the current result in memory when only the sort changed and every record is loaded."""
+        if not self._query_key or self._query_key[0::2] != key[0::2] or len(self.records) < self._total_records:
+            return False
+        sort = key[1]
+        try:
+            records = sorted(self.records, key=_sort_key(sort.lstrip('-')), reverse=sort.startswith('-'))
+        except TypeError:
+            return False  # Missing values do not compare in Python; let the database order them
+        self.records = records
+        self._query = self._build_query(key)
+        self._use_in_memory_result(key)
+        return True
+
+    def _filter_base_result(self, key) -> bool:
+        """Answer a status filter from the cached unfiltered result of the same sort and search, if fully loaded."""
+        if key[0] == "all":
+            return False
+        cached = self._cached_result(("all",) + key[1:])
+        if not cached or len(cached[0]) < cached[1]:
+            return False
+
+        # The status column is built once per base result and reused by every filter click
+        records = cached[0]
+        if self._status_source is not records:
+            self._status_column = [r.processed for r in records]
+            self._status_source = records
+        status = self._build_query(key)['processed_status']
+        self.records = [records[i] for i, processed in enumerate(self._status_column) if processed == status]
+        self._query = self._build_query(key)
+        self._stored_at = cached[3]
+        self._use_in_memory_result(key)
+        return True
+
     def sort_treeview(self, column):
-        """Set the sort column and refresh the display."""
+        """Sort by a column; clicking the sorted column again reverses the order."""
+        self._sort_desc = column == self.sort_var.get() and not self._sort_desc
         self.sort_var.set(column)
         self.apply_filter()
 
+    def _on_sort_selected(self, event=None):
+        """Sort ascending by the column picked in the sort options."""
+        self._sort_desc = False
+        self._schedule_refresh()
+
     def create_context_menu(self):
         """Create a right-click context menu for the treeview."""
         self.context_menu = tk.Menu(self.tree, tearoff=0)
@@ -527,15 +1272,14 @@ class RecordsInterface:
                                 command=lambda: self.mark_selected_records(ProcessedStatus.UNPROCESSED))
         self.context_menu.add_cascade(label="Changer le Statut", menu=status_menu)
 
-        self.tree.bind("<Button-3>", self.show_context_menu)
-        self.tree.bind("<Double-1>", self.on_double_click)
-
     def show_context_menu(self, event):
         """Show the context menu on right-click."""
         # Select row under mouse
         iid = self.tree.identify_row(event.y)
         if iid:
             self.tree.selection_set(iid)
+            if self.context_menu is None:
+                self.create_context_menu()
             self.context_menu.post(event.x_root, event.y_root)
 
     def on_double_click(self, event):
@@ -544,11 +1288,11 @@ class RecordsInterface:
         if not selected_item:
             return
 
-        record_values = self.tree.item(selected_item, "values")
-        processed_status = record_values[4]
+        # Item ids are record ids, so the record is found without reading the row back from Tk
+        record = self._find_record(int(selected_item[0]))
 
         # If the record has error status, show errors
-        if "Erreur" in processed_status:
+        if record and record.processed == ProcessedStatus.ERROR:
             self.view_errors()
 
     def toggle_processed_status(self, processed_status):
@@ -562,10 +1306,7 @@ class RecordsInterface:
             self.show_error("Veuillez sélectionner un enregistrement.")
             return
 
-        record_values = self.tree.item(selected_item, "values")
-        record_id = int(record_values[0])
-
-        record = next((r for r in self.records if r.id == record_id), None)
+        record = self._find_record(int(selected_item[0]))
         if not record:
             self.show_error("Enregistrement non trouvé.")
             return
@@ -583,43 +1324,32 @@ class RecordsInterface:
                 record.errors = []
 
             # Update record in repository
-            self.attendance_repository.update_record(record)
-
-            # Show success message
-            status_map = {
-                ProcessedStatus.PROCESSED: "Traité",
-                ProcessedStatus.UNPROCESSED: "Non Traité",
-                ProcessedStatus.ERROR: "Erreur"
-            }
-            self.show_success(f"Enregistrement marqué comme {status_map.get(processed_status, 'inconnu')} avec succès.")
+            self._enqueue_update(record)
 
             # Refresh display
-            self.load_records()
-            self.display_records()
+            self._upsert_tree_row(record)
+
+            # Show success message
+            self.show_success(f"Enregistrement marqué comme {_STATUS_NAMES.get(processed_status, 'inconnu')} avec succès.")
 
         except Exception as e:
             self.handle_error(f"Erreur lors de la mise à jour de l'enregistrement", e)
 
     def add_error_to_record(self, record):
         """Add error information to a record."""
+        # The dialog is built once and reused; each call only resets its fields and target record
+        if not self._dialog_alive(self._add_error_window):
+            self._build_add_error_window()
+        self._add_error_record = record
+        for var, default in zip(self._add_error_vars, self.ADD_ERROR_DEFAULTS):
+            var.set(default)
+        self._show_dialog(self._add_error_window)
+
+    def _build_add_error_window(self):
+        """Create the hidden add-error dialog."""
         # Create a dialog to add error details
-        error_window = tk.Toplevel(self.root)
-        error_window.title("Ajouter des Détails d'Erreur")
-        error_window.geometry("400x300")
-        error_window.transient(self.root)
-        error_window.grab_set()
-
-        # Set window style
-        error_window.configure(background=self.COLOR_BACKGROUND)
-
-        # Create a frame with padding
-        main_frame = ttk.Frame(error_window, padding=10, style='TFrame')
-        main_frame.pack(fill=tk.BOTH, expand=True)
-
-        # Title
-        title_label = ttk.Label(main_frame, text="Ajouter des Détails d'Erreur",
-                                font=("Segoe UI", 12, "bold"), style='Title.TLabel')
-        title_label.pack(pady=(0, 10))
+        error_window, main_frame, _ = self._make_dialog("Ajouter des Détails d'Erreur",
+                                                        "Ajouter des Détails d'Erreur", "400x300")
 
         # Form fields
         form_frame = ttk.Frame(main_frame, style='TFrame')
@@ -627,26 +1357,27 @@ class RecordsInterface:
 
         # Field entry
         ttk.Label(form_frame, text="Champ:", style='TLabel').grid(row=0, column=0, sticky=tk.W, padx=5, pady=5)
-        field_var = tk.StringVar(value="entry")
+        field_var = tk.StringVar()
         field_combo = ttk.Combobox(form_frame, textvariable=field_var,
                                    values=["entry", "timestamp", "punch_type", "username"])
         field_combo.grid(row=0, column=1, padx=5, pady=5, sticky=tk.W + tk.E)
 
         # Error code entry
         ttk.Label(form_frame, text="Code d'Erreur:", style='TLabel').grid(row=1, column=0, sticky=tk.W, padx=5, pady=5)
-        code_var = tk.StringVar(value="E4")
+        code_var = tk.StringVar()
         code_entry = ttk.Entry(form_frame, textvariable=code_var)
         code_entry.grid(row=1, column=1, padx=5, pady=5, sticky=tk.W + tk.E)
 
         # Error message entry
         ttk.Label(form_frame, text="Message d'Erreur:", style='TLabel').grid(row=2, column=0, sticky=tk.W, padx=5,
                                                                              pady=5)
-        message_var = tk.StringVar(value="Pointages qui se chevauchent")
+        message_var = tk.StringVar()
         message_entry = ttk.Entry(form_frame, textvariable=message_var)
         message_entry.grid(row=2, column=1, padx=5, pady=5, sticky=tk.W + tk.E)
 
         # Validation and submission
         def submit():
+            record = self._add_error_record
             field = field_var.get().strip()
             code = code_var.get().strip()
             message = message_var.get().strip()
@@ -669,22 +1400,24 @@ class RecordsInterface:
             record.processed = ProcessedStatus.ERROR
 
             # Update database
-            self.attendance_repository.update_record(record)
+            self._enqueue_update(record)
 
             # Refresh display
-            self.load_records()
-            self.display_records()
-            error_window.destroy()
+            self._upsert_tree_row(record)
+            self._hide_dialog(error_window)
 
         # Buttons
         button_frame = ttk.Frame(main_frame, style='TFrame')
         button_frame.pack(fill=tk.X, pady=10)
 
-        ttk.Button(button_frame, text="Annuler", command=error_window.destroy,
+        ttk.Button(button_frame, text="Annuler", command=lambda: self._hide_dialog(error_window),
                    style='TButton').pack(side=tk.LEFT, padx=5)
         ttk.Button(button_frame, text="Ajouter Erreur", command=submit,
                    style='Action.TButton').pack(side=tk.RIGHT, padx=5)
 
+        self._add_error_window = error_window
+        self._add_error_vars = (field_var, code_var, message_var)
+
     def view_errors(self):
         """View errors for the selected record."""
         selected_item = self.tree.selection()
@@ -692,37 +1425,63 @@ class RecordsInterface:
             self.show_error("Veuillez sélectionner un enregistrement pour voir les erreurs.")
             return
 
-        record_values = self.tree.item(selected_item, "values")
-        record_id = int(record_values[0])
-        processed_status = record_values[4]
-
-        record = next((r for r in self.records if r.id == record_id), None)
+        record_id = int(selected_item[0])
+        record = self._find_record(record_id)
         if not record:
             self.show_error("Enregistrement non trouvé.")
             return
 
-        if not "Erreur" in processed_status or not hasattr(record, 'errors') or not record.errors:
+        if record.processed != ProcessedStatus.ERROR or not hasattr(record, 'errors') or not record.errors:
             self.show_error("Aucune erreur à afficher pour cet enregistrement.")
             return
 
-        # Display errors in a new window
-        error_window = tk.Toplevel(self.root)
+        # The window is built once and reused; each call only swaps its title, rows and record
+        if not self._dialog_alive(self._error_view_window):
+            self._build_error_view_window()
+        self._error_view_record = record
+        self._error_view_dirty = False
+        error_window = self._error_view_window
         error_window.title(f"Erreurs pour l'Enregistrement #{record_id}")
-        error_window.geometry("800x500")
-        error_window.transient(self.root)
-        error_window.grab_set()
+        self._error_view_title.config(text=f"Erreurs pour l'Enregistrement #{record_id}")
+
+        # Process errors list
+        errors = record.errors
+        if isinstance(errors, str):
+            errors = record.errors = self.convert_error_string_to_table(errors)
+
+        # Format the error rows; each item id maps back to its error, for deletion
+        error_tree = self._error_view_tree
+        error_tree.delete(*error_tree.get_children())
+        self._error_view_items = {}
+        items = []
+        for n, error in enumerate(errors):
+            if isinstance(error, dict):
+                field = error.get("field", "N/A")
+                code = error.get("code", "N/A")
+                message = get_error_message(code)
+                if not message:
+                    message = error.get("message", "N/A")
+            else:
+                field = "N/A"
+                code = "N/A"
+                message = str(error)
 
-        # Set window style
-        error_window.configure(background=self.COLOR_BACKGROUND)
+            iid = f"e{n}"
+            self._error_view_items[iid] = error
+            items += (iid, (field, code, message))
 
-        # Create a frame with padding
-        main_frame = ttk.Frame(error_window, padding=10, style='TFrame')
-        main_frame.pack(fill=tk.BOTH, expand=True)
+        # and insert them all in one Tcl call, as the records list does
+        error_tree.tk.call('apply', self._INSERT_ITEMS, error_tree._w, tuple(items))
 
-        # Title
-        title_label = ttk.Label(main_frame, text=f"Erreurs pour l'Enregistrement #{record_id}",
-                                font=("Segoe UI", 12, "bold"), style='Title.TLabel')
-        title_label.pack(pady=(0, 10))
+        self._show_dialog(error_window)
+
+    def _build_error_view_window(self):
+        """Create the hidden error view window."""
+        # The titles name the record, so they are set each time the window is shown
+        error_window, main_frame, title_label = self._make_dialog(size="800x500")
+        # Closing from the title bar must save removed errors too
+        error_window.protocol("WM_DELETE_WINDOW",
+                              lambda: self.close_error_window(error_window, self._error_view_record))
 
         # Create a treeview to display errors
         error_frame = ttk.Frame(main_frame, style='TFrame')
@@ -748,47 +1507,73 @@ class RecordsInterface:
         error_tree.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
         error_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
-        # Process errors list
-        errors = record.errors
-        if isinstance(errors, str):
-            errors = self.convert_error_string_to_table(errors)
-
-        # Insert errors into the treeview
-        for error in errors:
-            if isinstance(error, dict):
-                field = error.get("field", "N/A")
-                code = error.get("code", "N/A")
-                message = get_error_message(code)
-                if not message:
-                    message = error.get("message", "N/A")
-            else:
-                field = "N/A"
-                code = "N/A"
-                message = str(error)
-
-            error_tree.insert("", tk.END, values=(field, code, message))
-
         # Buttons for error management
         button_frame = ttk.Frame(main_frame, style='TFrame')
         button_frame.pack(fill=tk.X, pady=10)
 
         # ttk.Button(button_frame, text="Ajouter Erreur",
-        #            command=lambda: self.add_error_to_record(record),
+        #            command=lambda: self.add_error_to_record(self._error_view_record),
         #            style='Action.TButton').pack(side=tk.LEFT, padx=5)
         # ttk.Button(button_frame, text="Supprimer l'Erreur Sélectionnée",
-        #            command=lambda: self.delete_selected_error(record, error_tree),
+        #            command=lambda: self.delete_selected_error(self._error_view_record, error_tree),
         #            style='Action.TButton').pack(side=tk.LEFT, padx=5)
         ttk.Button(button_frame, text="Fermer",
-                   command=lambda: self.close_error_window(error_window, record),
+                   command=lambda: self.close_error_window(error_window, self._error_view_record),
                    style='TButton').pack(side=tk.RIGHT, padx=5)
 
+        self._error_view_window = error_window
+        self._error_view_title = title_label
+        self._error_view_tree = error_tree
+
+    @staticmethod
+    def _dialog_alive(window) -> bool:
+        """Check whether a pooled dialog can still be reused."""
+        return window is not None and bool(window.winfo_exists())
+
+    def _make_dialog(self, title: Optional[str] = None, heading: Optional[str] = None,
+                     size: Optional[str] = None):
+        """Create the hidden skeleton shared by the pooled dialogs: window, padded main frame and heading label.
+
+        Closing the window hides it; callers needing more on close replace the protocol handler.
+        """
+        window = tk.Toplevel(self.root)
+        window.withdraw()
+        if title:
+            window.title(title)
+        if size:
+            window.geometry(size)
+        window.transient(self.root)
+        window.protocol("WM_DELETE_WINDOW", lambda: self._hide_dialog(window))
+        window.configure(background=self.COLOR_BACKGROUND)
+
+        # Create a frame with padding
+        main_frame = ttk.Frame(window, padding=10, style='TFrame')
+        main_frame.pack(fill=tk.BOTH, expand=True)
+
+        # Title
+        title_label = ttk.Label(main_frame, text=heading or "", font=("Segoe UI", 12, "bold"), style='Title.TLabel')
+        title_label.pack(pady=(0, 10))
+        return window, main_frame, title_label
+
+    @staticmethod
+    def _show_dialog(window):
+        """Show a pooled dialog modally."""
+        window.deiconify()
+        window.lift()
+        window.grab_set()
+        window.focus_set()
+
+    @staticmethod
+    def _hide_dialog(window):
+        """Hide a pooled dialog so that it can be shown again without being rebuilt."""
+        window.grab_release()
+        window.withdraw()
+
     def convert_error_string_to_table(self, errors_str):
         """Convert an error string to a list of error dictionaries."""
         try:
-            table = ast.literal_eval(errors_str)
-            if isinstance(table, dict):
-                table = [table]
-            return table
+            # Copied so that editing a record's errors never alters the cached parse
+            return list(_parse_errors(errors_str))
         except Exception as e:
             logger.error(f"Error converting error string to table: {e}")
             return []
@@ -801,89 +1586,64 @@ class RecordsInterface:
                                  parent=error_tree.winfo_toplevel())
             return
 
-        index = error_tree.index(selected_item)
-        if 0 <= index < len(record.errors):
+        removed = [self._error_view_items.pop(iid) for iid in selected_item if iid in self._error_view_items]
+        if removed:
             # Remove error from record
-            record.errors.pop(index)
-            error_tree.delete(selected_item)
+            for error in removed:
+                record.errors.remove(error)
+            error_tree.delete(*selected_item)
 
             # If no more errors, change status to unprocessed
             if not record.errors:
                 record.processed = ProcessedStatus.UNPROCESSED
 
-            # Update record in database
-            self.attendance_repository.update_record(record)
-
-            # Refresh display
-            self.load_records()
-            self.display_records()
+            # Refresh its row now; the record is written once, when the window is closed
+            self._error_view_dirty = True
+            self._upsert_tree_row(record)
 
     def close_error_window(self, window, record=None):
-        """Close the error window and update the record if needed."""
-        if record:
-            self.attendance_repository.update_record(record)
-            self.load_records()
-            self.display_records()
-        window.destroy()
+        """Close the error window and update the record if its errors were changed."""
+        if record and self._error_view_dirty:
+            self._enqueue_update(record)
+        self._error_view_dirty = False
+        self._hide_dialog(window)
 
     def add_record(self):
         """Open a form to add a new attendance record."""
-        form = tk.Toplevel(self.root)
-        form.title("Ajouter un Enregistrement de Présence")
-        form.transient(self.root)
-        form.grab_set()
-        form.configure(background=self.COLOR_BACKGROUND)
-
-        # Create a frame with padding
-        main_frame = ttk.Frame(form, padding=10, style='TFrame')
-        main_frame.pack(fill=tk.BOTH, expand=True)
-
-        # Title
-        title_label = ttk.Label(main_frame, text="Ajouter un Nouvel Enregistrement",
-                                font=("Segoe UI", 12, "bold"), style='Title.TLabel')
-        title_label.pack(pady=(0, 10))
+        # The form is built once and reused; each call only clears its fields
+        if not self._dialog_alive(self._add_form):
+            self._build_add_form()
+        entries, combos = self._add_form_entries, self._add_form_combos
+        entries["username"].set("")
+        entries["timestamp"].set("")
+        combos["punch_type"].current(0)  # Default to IN (0)
+        combos["processed"].current(0)
+        self._show_dialog(self._add_form)
+
+    def _build_add_form(self):
+        """Create the hidden add-record form."""
+        form, main_frame, _ = self._make_dialog("Ajouter un Enregistrement de Présence",
+                                                "Ajouter un Nouvel Enregistrement")
 
         # Form fields in a grid layout
         form_frame = ttk.Frame(main_frame, style='TFrame')
         form_frame.pack(fill=tk.BOTH, padx=5, pady=5)
 
-        # Create form fields
-        fields = (
-            ("username", "Code Employé"),
-            ("timestamp", "Horodatage (AAAA-MM-JJ HH:MM:SS)"),
-            ("punch_type", "Type de Pointage"),
-            ("processed", "Statut")
-        )
         entries = {}
+        combos = {}
 
         # Build form fields
-        for idx, (field, label) in enumerate(fields):
+        for idx, (field, label) in enumerate(_ADD_FIELDS):
             ttk.Label(form_frame, text=label + ":", style='TLabel').grid(row=idx, column=0, sticky=tk.W, padx=5, pady=5)
 
-            if field == "punch_type":
-                var = tk.StringVar(value="0 - Entrée")  # Default to IN (0)
-                combo = ttk.Combobox(form_frame, textvariable=var, values=[
-                    "0 - Entrée",
-                    "1 - Sortie"
-                ])
-                combo.current(0)
-                combo.grid(row=idx, column=1, padx=5, pady=5, sticky=tk.W + tk.E)
-                entries[field] = var
-            elif field == "processed":
-                var = tk.StringVar(value=ProcessedStatus.UNPROCESSED)
-                combo = ttk.Combobox(form_frame, textvariable=var, values=[
-                    ProcessedStatus.UNPROCESSED + " - Non Traité",
-                    ProcessedStatus.PROCESSED + " - Traité",
-                    ProcessedStatus.ERROR + " - Erreur"
-                ])
-                combo.current(0)
-                combo.grid(row=idx, column=1, padx=5, pady=5, sticky=tk.W + tk.E)
-                entries[field] = var
+            var = tk.StringVar()
+            if field in ("punch_type", "processed"):
+                choices = self._PUNCH_CHOICES if field == "punch_type" else self._PROCESSED_CHOICES
+                widget = combos[field] = ttk.Combobox(form_frame, textvariable=var, values=choices)
             else:
-                var = tk.StringVar()
-                entry = ttk.Entry(form_frame, textvariable=var)
-                entry.grid(row=idx, column=1, padx=5, pady=5, sticky=tk.W + tk.E)
-                entries[field] = var
+                widget = ttk.Entry(form_frame, textvariable=var)
+            widget.grid(row=idx, column=1, padx=5, pady=5, sticky=tk.W + tk.E)
+            entries[field] = var
 
         def submit():
             try:
@@ -894,20 +1654,13 @@ class RecordsInterface:
                 if not username or not timestamp:
                     self.show_error("Le code employé et l'horodatage sont des champs obligatoires.")
                     return
+                if not self._valid_timestamp(timestamp):
+                    self.show_error(self._INVALID_TIMESTAMP)
+                    return
 
-                # Get punch type value
-                punch_type_val = entries["punch_type"].get()
-                if isinstance(punch_type_val, str) and " - " in punch_type_val:
-                    punch_type = int(punch_type_val.split(" - ")[0])
-                else:
-                    punch_type = int(punch_type_val)
-
-                # Get processed status value
-                processed_val = entries["processed"].get()
-                if isinstance(processed_val, str) and " - " in processed_val:
-                    processed = processed_val.split(" - ")[0]
-                else:
-                    processed = processed_val
+                # Get punch type and processed status values
+                punch_type = self._parse_punch(entries["punch_type"].get())
+                processed = self._parse_processed(entries["processed"].get())
 
                 # Create new record
                 record = AttendanceRecord(
@@ -915,35 +1668,23 @@ class RecordsInterface:
                     timestamp=timestamp,
                     punch_type=punch_type,
                     processed=processed,
-                    user_id=0,  # This would be set based on username lookup
+                    user_id=self._resolve_user_id(username),
                     status=1  # Default status
                 )
 
-                # Find user ID if possible
-                if self.users:
-                    user = next((u for u in self.users if u.name == username), None)
-                    if user:
-                        record.user_id = user.user_id
+                # Save record using service or repository; the saved record comes back with its new id,
+                # so nothing has to be read back to find it
+                repository = (self.attendance_service.attendance_repository if self.attendance_service
+                              else self.attendance_repository)
+                record = repository.save_record(record)
 
-                # Save record using service or repository
-                if self.attendance_service:
-                    self.attendance_service.attendance_repository.save_record(record)
-                else:
-                    self.attendance_repository.save_record(record)
-
-                # Handle error status if needed
+                # Handle error status if needed; the record may not be on the loaded page
                 if record.processed == ProcessedStatus.ERROR:
-                    # Need to get the saved record with ID first
-                    self.load_records()
-                    saved_record = next((r for r in self.records if r.username == record.username and
-                                         r.timestamp == record.timestamp), None)
-                    if saved_record:
-                        self.add_error_to_record(saved_record)
+                    self.add_error_to_record(record)
 
+                self._upsert_tree_row(record)
                 self.show_success("Enregistrement ajouté avec succès.")
-                form.destroy()
-                self.load_records()
-                self.display_records()
+                self._hide_dialog(form)
 
             except Exception as e:
                 self.handle_error("Erreur lors de l'ajout de l'enregistrement", e)
@@ -952,11 +1693,48 @@ class RecordsInterface:
         button_frame = ttk.Frame(main_frame, style='TFrame')
         button_frame.pack(fill=tk.X, pady=10)
 
-        ttk.Button(button_frame, text="Annuler", command=form.destroy,
+        ttk.Button(button_frame, text="Annuler", command=lambda: self._hide_dialog(form),
                    style='TButton').pack(side=tk.LEFT, padx=5)
         ttk.Button(button_frame, text="Soumettre", command=submit,
                    style='Action.TButton').pack(side=tk.RIGHT, padx=5)
 
+        self._add_form = form
+        self._add_form_entries = entries
+        self._add_form_combos = combos
+
+    @classmethod
+    def _valid_timestamp(cls, value: str) -> bool:
+        """Check a typed timestamp against the format the device records use."""
+        try:
+            datetime.strptime(value.strip(), cls._TS_FMT)
+        except ValueError:
+            return False
+        return True
+
+    @staticmethod
+    def _parse_int(value) -> Optional[int]:
+        """Return value as an int, None when it is not one."""
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            return None
+
+    @classmethod
+    def _parse_punch(cls, value) -> int:
+        """Return the punch type of a form value, either a combobox choice or a typed code."""
+        punch_type = cls._PARSE_PUNCH.get(value)
+        if punch_type is None:
+            punch_type = int(str(value).partition(" - ")[0])  # partition stops at the first separator
+        return punch_type
+
+    @classmethod
+    def _parse_processed(cls, value) -> str:
+        """Return the processed status of a form value, either a combobox choice or a typed status."""
+        processed = _PROCESSED_FROM_LABEL.get(value)
+        if processed is None:
+            processed = value.partition(" - ")[0] if isinstance(value, str) else value
+        return processed
+
     def update_record(self):
         """Update the selected attendance record."""
         selected_item = self.tree.selection()
@@ -964,108 +1742,85 @@ class RecordsInterface:
             self.show_error("Veuillez sélectionner un enregistrement à mettre à jour.")
             return
 
-        # Get the selected record's values
-        record_values = self.tree.item(selected_item, "values")
-        record_id = int(record_values[0])
-
-        # Retrieve the full record
-        record = next((r for r in self.records if r.id == record_id), None)
+        # Retrieve the full record; item ids are record ids
+        record = self._find_record(int(selected_item[0]))
         if not record:
             self.show_error("Enregistrement non trouvé.")
             return
 
-        form = tk.Toplevel(self.root)
-        form.title("Mettre à jour l'Enregistrement de Présence")
-        form.transient(self.root)
-        form.grab_set()
-        form.configure(background=self.COLOR_BACKGROUND)
+        # The form is built once and reused; each call only loads the record into it
+        if not self._dialog_alive(self._edit_form):
+            self._build_edit_form()
+        self._edit_record = record
+        self._edit_form_title.config(text=f"Mettre à jour l'Enregistrement #{record.id}")
+
+        entries, combos = self._edit_form_entries, self._edit_form_combos
+        entries["username"].set(record.username)
+        entries["timestamp"].set(record.timestamp)
+        entries["status"].set(record.status)
+        combos["punch_type"].current(record.punch_type)
+
+        # Select the current value, keeping unknown ones as typed text
+        index = self._PROCESSED_INDEX.get(record.processed)
+        if index is not None:
+            combos["processed"].current(index)
+        else:
+            combos["processed"].set(record.processed)
 
-        # Create a frame with padding
-        main_frame = ttk.Frame(form, padding=10, style='TFrame')
-        main_frame.pack(fill=tk.BOTH, expand=True)
+        self._show_dialog(self._edit_form)
 
-        # Title with record ID
-        title_label = ttk.Label(main_frame, text=f"Mettre à jour l'Enregistrement #{record_id}",
-                                font=("Segoe UI", 12, "bold"), style='Title.TLabel')
-        title_label.pack(pady=(0, 10))
+    def _build_edit_form(self):
+        """Create the hidden update-record form."""
+        # Title with record ID, set each time the form is shown
+        form, main_frame, title_label = self._make_dialog("Mettre à jour l'Enregistrement de Présence")
 
         # Form fields in a grid layout
         form_frame = ttk.Frame(main_frame, style='TFrame')
         form_frame.pack(fill=tk.BOTH, padx=5, pady=5)
 
-        fields = (
-            ("username", "Code Employé", record.username),
-            ("timestamp", "Horodatage", record.timestamp),
-            ("status", "Code Statut", record.status),
-            ("punch_type", "Type de Pointage", record.punch_type),
-            ("processed", "Statut de Traitement", record.processed)
-        )
         entries = {}
+        combos = {}
 
-        # Create form fields with initial values
-        for idx, (field, label, value) in enumerate(fields):
+        # Create form fields; their values are filled in by update_record
+        for idx, (field, label) in enumerate(_UPDATE_FIELDS):
             ttk.Label(form_frame, text=label + ":", style='TLabel').grid(row=idx, column=0, sticky=tk.W, padx=5, pady=5)
 
-            if field == "punch_type":
-                var = tk.StringVar(value=value)
-                combo = ttk.Combobox(form_frame, textvariable=var, values=[
-                    "0 - Entrée",
-                    "1 - Sortie"
-                ])
-                combo.current(value)
-                combo.grid(row=idx, column=1, padx=5, pady=5, sticky=tk.W + tk.E)
-                entries[field] = var
-            elif field == "processed":
-                var = tk.StringVar(value=value)
-                combo = ttk.Combobox(form_frame, textvariable=var, values=[
-                    ProcessedStatus.UNPROCESSED + " - Non Traité",
-                    ProcessedStatus.PROCESSED + " - Traité",
-                    ProcessedStatus.ERROR + " - Erreur"
-                ])
-
-                # Find the index of the current value
-                values = [ProcessedStatus.UNPROCESSED, ProcessedStatus.PROCESSED, ProcessedStatus.ERROR]
-                try:
-                    index = values.index(value)
-                    combo.current(index)
-                except ValueError:
-                    combo.set(value)
-
-                combo.grid(row=idx, column=1, padx=5, pady=5, sticky=tk.W + tk.E)
-                entries[field] = var
+            var = tk.StringVar()
+            if field in ("punch_type", "processed"):
+                choices = self._PUNCH_CHOICES if field == "punch_type" else self._PROCESSED_CHOICES
+                widget = combos[field] = ttk.Combobox(form_frame, textvariable=var, values=choices)
             else:
-                var = tk.StringVar(value=value)
-                entry = ttk.Entry(form_frame, textvariable=var)
-                entry.grid(row=idx, column=1, padx=5, pady=5, sticky=tk.W + tk.E)
-                entries[field] = var
+                widget = ttk.Entry(form_frame, textvariable=var)
+            widget.grid(row=idx, column=1, padx=5, pady=5, sticky=tk.W + tk.E)
+            entries[field] = var
 
         def submit():
+            record = self._edit_record
             try:
+                # Validate before touching the record, so a rejected form leaves it unchanged
+                timestamp = entries["timestamp"].get()
+                if not self._valid_timestamp(timestamp):
+                    self.show_error(self._INVALID_TIMESTAMP)
+                    return
+                status = self._parse_int(entries["status"].get())
+                if status is None:
+                    self.show_error("Le code statut doit être un nombre entier.")
+                    return
+
                 # Update record with form values
                 record.username = entries["username"].get()
-                record.timestamp = entries["timestamp"].get()
-                record.status = int(entries["status"].get())
-
-                # Get punch type value
-                punch_type_val = entries["punch_type"].get()
-                if isinstance(punch_type_val, str) and " - " in punch_type_val:
-                    record.punch_type = int(punch_type_val.split(" - ")[0])
-                else:
-                    record.punch_type = int(punch_type_val)
-
-                # Get processed status value
-                processed_val = entries["processed"].get()
-                if isinstance(processed_val, str) and " - " in processed_val:
-                    record.processed = processed_val.split(" - ")[0]
-                else:
-                    record.processed = processed_val
+                record.timestamp = timestamp
+                record.status = status
+
+                # Get punch type and processed status values
+                record.punch_type = self._parse_punch(entries["punch_type"].get())
+                record.processed = self._parse_processed(entries["processed"].get())
 
                 # Call update in the repository
-                self.attendance_repository.update_record(record)
+                self._enqueue_update(record)
+                self._upsert_tree_row(record)
                 self.show_success("Enregistrement mis à jour avec succès.")
-                form.destroy()
-                self.load_records()
-                self.display_records()
+                self._hide_dialog(form)
             except Exception as e:
                 self.handle_error("Erreur lors de la mise à jour de l'enregistrement", e)
 
@@ -1073,11 +1828,16 @@ class RecordsInterface:
         button_frame = ttk.Frame(main_frame, style='TFrame')
         button_frame.pack(fill=tk.X, pady=10)
 
-        ttk.Button(button_frame, text="Annuler", command=form.destroy,
+        ttk.Button(button_frame, text="Annuler", command=lambda: self._hide_dialog(form),
                    style='TButton').pack(side=tk.LEFT, padx=5)
         ttk.Button(button_frame, text="Enregistrer les Modifications", command=submit,
                    style='Action.TButton').pack(side=tk.RIGHT, padx=5)
 
+        self._edit_form = form
+        self._edit_form_title = title_label
+        self._edit_form_entries = entries
+        self._edit_form_combos = combos
+
     def delete_selected_records(self):
         """Delete multiple selected attendance records."""
         if not self.attendance_repository:
@@ -1096,21 +1856,25 @@ class RecordsInterface:
                                    parent=self.root):
             return
 
-        # Extract record IDs from selected items
-        record_ids = []
-        for item in selected_items:
-            record_values = self.tree.item(item, "values")
-            record_id = int(record_values[0])
-            record_ids.append(record_id)
+        # Item ids are record ids
+        record_ids = [int(item) for item in selected_items]
+
+        # Delete the records on the worker pool, after the edits queued before (they must not land after the delete)
+        self._set_status("Suppression des enregistrements...", 'warning')
+        fut = self._chain_write(self.attendance_repository.delete_records, record_ids)
+        when_done(self.root, partial(self._on_records_deleted, record_ids), fut)
 
+    def _on_records_deleted(self, record_ids: List[int], fut):
+        """Remove the deleted records from the list once the repository has deleted them."""
+        if fut is self._pending_write:
+            self._pending_write = None
         try:
-            # Delete the records
-            self.attendance_repository.delete_records(record_ids)
-            self.show_success(f"{count} enregistrements supprimés avec succès.")
-            self.load_records()
-            self.display_records()
+            fut.result()
         except Exception as e:
             self.handle_error("Erreur lors de la suppression des enregistrements", e)
+            return
+        self._delete_tree_rows(set(record_ids))
+        self.show_success(f"{len(record_ids)} enregistrements supprimés avec succès.")
 
     def mark_selected_records(self, status):
         """Mark multiple selected records with the specified status."""
@@ -1124,12 +1888,7 @@ class RecordsInterface:
             return
 
         # Get status display name for messages
-        status_map = {
-            ProcessedStatus.PROCESSED: "Traité",
-            ProcessedStatus.UNPROCESSED: "Non Traité",
-            ProcessedStatus.ERROR: "Erreur"
-        }
-        status_display = status_map.get(status, status)
+        status_display = _STATUS_NAMES.get(status, status)
 
         # Confirm action
         count = len(selected_items)
@@ -1143,21 +1902,31 @@ class RecordsInterface:
             self.show_error("Pour marquer comme erreur, veuillez modifier les enregistrements individuellement.")
             return
 
-        # Extract record IDs from selected items
-        record_ids = []
-        for item in selected_items:
-            record_values = self.tree.item(item, "values")
-            record_id = int(record_values[0])
-            record_ids.append(record_id)
+        # Item ids are record ids
+        record_ids = [int(item) for item in selected_items]
+
+        # Update the records status on the worker pool, after the edits queued before (they must not overwrite it)
+        self._set_status("Modification du statut des enregistrements...", 'warning')
+        fut = self._chain_write(self.attendance_repository.mark_records_by_ids, record_ids, status)
+        when_done(self.root, partial(self._on_records_marked, record_ids, status, status_display), fut)
 
+    def _on_records_marked(self, record_ids: List[int], status, status_display: str, fut):
+        """Show the new status of the marked records once the repository has stored it."""
+        if fut is self._pending_write:
+            self._pending_write = None
         try:
-            # Update the records status
-            self.attendance_repository.mark_records_by_ids(record_ids, status)
-            self.show_success(f"{count} enregistrements marqués comme '{status_display}' avec succès.")
-            self.load_records()
-            self.display_records()
+            fut.result()
         except Exception as e:
             self.handle_error(f"Erreur lors de la modification du statut des enregistrements", e)
+            return
+
+        # The repository also clears their errors; mirror that on the loaded records
+        records = [r for r in map(self._find_record, record_ids) if r]
+        for record in records:
+            record.processed = status
+            record.errors = []
+        self._upsert_tree_rows(records)
+        self.show_success(f"{len(record_ids)} enregistrements marqués comme '{status_display}' avec succès.")
 
     def synchronize_records(self):
         """Synchronize attendance records with the API."""
@@ -1165,49 +1934,78 @@ class RecordsInterface:
             self.show_error("Service de synchronisation non disponible")
             return
 
-        try:
-            # Show synchronizing status
-            self.status_var.set("Synchronisation des enregistrements...")
-            self.status_label.config(style='Warning.TLabel')
-            self.root.update()
+        if self._sync_running:
+            return  # Already uploading
+
+        # Show synchronizing status; the upload runs on the worker pool so the window stays responsive
+        self._flush_writes()  # Upload what the user sees
+        self._sync_running = True
+        self._set_status("Synchronisation des enregistrements...", 'warning')
+        fut = self._executor.submit(self._upload_after_writes, self._pending_write)
+        when_done(self.root, self._finish_sync, fut)
 
-            # Perform synchronization
-            result = self.sync_service.upload_attendance_to_api()
+    def _upload_after_writes(self, pending_write):
+        """Upload the records once the edits queued before the sync are written. Runs on a worker."""
+        if pending_write is not None:
+            wait((pending_write,))
+        return self.sync_service.upload_attendance_to_api()
+
+    def _finish_sync(self, fut):
+        """Report the result of a synchronization and refresh the records it changed."""
+        try:
+            result = fut.result()
 
             # Update status based on result
             if result.get('success', False):
                 message = result.get('message',
                                      f"Synchronisé avec succès: {result.get('processed', 0)} enregistrements traités")
-                self.status_var.set(message)
-                self.status_label.config(style='Success.TLabel')
                 self.show_success(message)
             else:
                 message = result.get('message', "Échec de la synchronisation")
-                self.status_var.set(f"Erreur: {message}")
-                self.status_label.config(style='Error.TLabel')
                 self.show_error(message)
 
             # Refresh display
-            self.load_records()
-            self.display_records()
+            self._load_records_async()
 
         except Exception as e:
             self.handle_error("Erreur lors de la synchronisation des enregistrements", e)
+        finally:
+            self._sync_running = False
+
+    def _set_status(self, message: str, status_type: str):
+        """Show a message in the status bar, touching the variable and the style only when they change."""
+        if message != self._last_status_message:
+            self.status_var.set(message)
+            self._last_status_message = message
+        style = _STYLE_FOR[status_type]
+        if style != self._last_status_style:
+            self.status_label.config(style=style)
+            self._last_status_style = style
 
     def show_error(self, message: str):
         """Display an error message to the user."""
-        self.status_var.set(message)
-        self.status_label.config(style='Error.TLabel')
+        self._set_status(message, 'error')
         messagebox.showerror("Erreur", message, parent=self.root)
 
     def show_success(self, message: str):
         """Display a success message to the user."""
-        self.status_var.set(message)
-        self.status_label.config(style='Success.TLabel')
+        self._set_status(message, 'success')
         messagebox.showinfo("Succès", message, parent=self.root)
 
     def handle_error(self, message: str, exception: Exception):
-        """Log and display an error message."""
+        """Log and display an error message.
+
+        Failures reported within ERROR_BATCH_MS of each other are shown in a single dialog.
+        """
         error_msg = f"{message}: {exception}"
         logger.error(error_msg)
-        self.show_error(error_msg)
\ No newline at end of file
+        self._set_status(error_msg, 'error')
+        self._pending_errors.append(error_msg)
+        if len(self._pending_errors) == 1:
+            self.root.after(self.ERROR_BATCH_MS, self._flush_errors)
+
+    def _flush_errors(self):
+        """Show the failures gathered by handle_error in one dialog."""
+        errors, self._pending_errors = self._pending_errors, []
+        if errors and self.root.winfo_exists():
+            messagebox.showerror("Erreur", "\n".join(errors), parent=self.root)
\ No newline at end of file
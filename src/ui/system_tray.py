@@ -2,7 +2,6 @@
 import os
 import sys
 import logging
-import tempfile
 import threading
 import pystray
 from PIL import Image, ImageDraw
@@ -13,6 +12,8 @@ logger = logging.getLogger(__name__)
 class SystemTrayManager:
     """Manages the system tray icon and functionality."""
 
+    _icon_image = None  # Decoded tray image, loaded once and reused by every setup
+
     def __init__(self, app, show_callback, exit_callback):
         """
         Initialize the system tray manager.
@@ -34,17 +35,8 @@ class SystemTrayManager:
     def setup(self):
         """Setup the system tray icon and menu."""
         try:
-            # Get icon path
-            icon_path = self.resource_path("assets/timesync-logo.ico")
-            if not os.path.exists(icon_path):
-                # Fallback to PNG if ICO not available
-                icon_path = self.resource_path("assets/timesync-logo.png")
-                if not os.path.exists(icon_path):
-                    # Create a blank image if icon files aren't available
-                    icon_path = self.create_default_icon()
-
             # Load the icon image
-            icon_image = Image.open(icon_path)
+            icon_image = self.load_icon_image()
 
             # Define menu items
             menu = (
@@ -65,18 +57,30 @@ class SystemTrayManager:
         except Exception as e:
             logger.error(f"Failed to setup system tray icon: {e}")
 
+    def load_icon_image(self):
+        """Return the tray icon image, reading and decoding it from disk only the first time."""
+        if SystemTrayManager._icon_image is None:
+            # Get icon path
+            icon_path = self.resource_path("assets/timesync-logo.ico")
+            if not os.path.exists(icon_path):
+                # Fallback to PNG if ICO not available
+                icon_path = self.resource_path("assets/timesync-logo.png")
+
+            if os.path.exists(icon_path):
+                image = Image.open(icon_path)
+                image.load()  # Decode now, so the file is not read again later
+            else:
+                # Create a blank image if icon files aren't available
+                image = self.create_default_icon()
+            SystemTrayManager._icon_image = image
+        return SystemTrayManager._icon_image
+
     def create_default_icon(self):
-        """Create a default icon if none is available."""
-        try:
-            img = Image.new('RGB', (64, 64), color=(36, 57, 142))
-            d = ImageDraw.Draw(img)
-            d.text((20, 20), "TS", fill=(255, 255, 255))
-            temp_path = os.path.join(tempfile.gettempdir(), 'temp_icon.png')
-            img.save(temp_path)
-            return temp_path
-        except Exception as e:
-            logger.error(f"Failed to create default icon: {e}")
-            return None
+        """Create a default icon image in memory if none is available; pystray takes it as is."""
+        img = Image.new('RGB', (64, 64), color=(36, 57, 142))
+        d = ImageDraw.Draw(img)
+        d.text((20, 20), "TS", fill=(255, 255, 255))
+        return img
 
     def resource_path(self, relative_path):
         """Get absolute path to resource, works for dev and for PyInstaller."""
@@ -1,19 +1,89 @@
 # src/ui/users_interface.py
 import os
 import sys
-import threading
 import tkinter as tk
 from tkinter import ttk, messagebox
 import logging
-from typing import Optional, List
+from operator import attrgetter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, List
 
 from src.domain.models import User
 from src.data.repositories import AttendanceRepository
 from src.service.device_service import DeviceService
 from src.service.sync_service import SyncService
+from src.ui.polling import POLL_MS, when_done
 
 logger = logging.getLogger(__name__)
 
+# Directory resources are read from: PyInstaller's temp folder (_MEIPASS) when frozen, else the working directory
+_BASE_PATH = getattr(sys, '_MEIPASS', None) or os.path.abspath(".")
+
+# ttk styles are global to the Tk interpreter, so they only need configuring by the first window
+_STYLES_READY = False
+
+
+def _style_table(palette) -> tuple:
+    """(style name, options) pairs of the users window, from the colours of palette."""
+    return (
+        ('TFrame', dict(background=palette.COLOR_BACKGROUND)),
+        ('Header.TFrame', dict(background=palette.COLOR_PRIMARY)),
+        ('Card.TFrame', dict(background=palette.COLOR_CARD, relief='flat', borderwidth=0)),
+
+        # LabelFrame styles
+        ('TLabelframe', dict(background=palette.COLOR_BACKGROUND)),
+        ('TLabelframe.Label', dict(background=palette.COLOR_BACKGROUND, font=('Segoe UI', 9, 'bold'))),
+
+        ('TLabel', dict(background=palette.COLOR_BACKGROUND, font=('Segoe UI', 10))),
+        ('Card.TLabel', dict(background=palette.COLOR_CARD, font=('Segoe UI', 10))),
+        ('Header.TLabel', dict(background=palette.COLOR_PRIMARY, foreground='white', font=('Segoe UI', 12, 'bold'))),
+        ('Title.TLabel', dict(background=palette.COLOR_BACKGROUND, font=('Segoe UI', 14, 'bold'))),
+        ('SectionTitle.TLabel', dict(background=palette.COLOR_CARD, font=('Segoe UI', 12, 'bold'))),
+
+        # Status label styles
+        ('Success.TLabel', dict(foreground=palette.COLOR_SUCCESS, background=palette.COLOR_CARD)),
+        ('Error.TLabel', dict(foreground=palette.COLOR_ERROR, background=palette.COLOR_CARD)),
+        ('Warning.TLabel', dict(foreground=palette.COLOR_WARNING, background=palette.COLOR_CARD)),
+        ('Neutral.TLabel', dict(foreground=palette.COLOR_NEUTRAL, background=palette.COLOR_CARD)),
+
+        # Button styles
+        ('TButton', dict(font=('Segoe UI', 10), padding=6)),
+        ('Action.TButton', dict(padding=8)),
+        ('Delete.TButton', dict(padding=8)),
+
+        # Treeview styles
+        ('Treeview', dict(font=('Segoe UI', 10))),
+        ('Treeview.Heading', dict(font=('Segoe UI', 10, 'bold'))),
+    )
+
+
+def _ensure_styles_configured(palette):
+    """Configure the window's ttk styles, from the colours of palette, the first time a window needs them."""
+    global _STYLES_READY
+    if _STYLES_READY:
+        return
+    _STYLES_READY = True
+
+    style = ttk.Style()
+    style.theme_use('clam')
+    for name, options in _style_table(palette):
+        style.configure(name, **options)
+
+
+# Row builders for the shapes a user can come in, picked once per list by UsersInterface._row_adapter_for
+_row_from_user = attrgetter('id', 'user_id', 'name')  # Complete user object with all fields
+_row_from_partial = attrgetter('user_id', 'user_id', 'name')  # Missing id: user_id doubles as the uid
+
+
+def _row_from_dict(user: dict) -> tuple:
+    """Row for a dictionary representation of a user."""
+    return user.get('id', user.get('user_id', 'N/A')), user.get('user_id', 'N/A'), user.get('name', 'N/A')
+
+
+def _row_from_unknown(user) -> tuple:
+    """Row for a user of unknown format."""
+    return 'N/A', 'N/A', 'N/A'
+
 
 class UsersInterface:
     """Interface for managing users in the attendance system."""
@@ -27,6 +97,14 @@ class UsersInterface:
     COLOR_NEUTRAL = "#757575"  # Gray for neutral states
     COLOR_CARD = "#FFFFFF"  # White card background
 
+    # Rows are rendered lazily, as in the records window: a chunk at a time, when the view nears the end
+    RENDER_CHUNK = 200
+    RENDER_AHEAD = 0.9  # Fraction of the scroll range past which the next chunk is rendered
+    DELETE_BATCH_SIZE = 50  # Users removed per device call when deleting a selection
+
+    # Tcl lambda inserting a chunk of user rows in one call into Tcl, instead of one Treeview.insert per user
+    _INSERT_ROWS = "{tree rows} {foreach row $rows {$tree insert {} end -values $row}}"
+
     def __init__(
             self,
             root: Optional[tk.Tk],
@@ -60,6 +138,16 @@ class UsersInterface:
         # Status variable for displaying messages
         self.status_var = tk.StringVar(value="Prêt")
 
+        # Formatted rows of every user; only the first _rendered_count are inserted in the tree
+        self._rows: List[tuple] = []
+        self._rendered_count = 0
+        self._render_pending = False
+        self._deleted_count = 0  # Users removed so far by the running deletion
+        self._row_adapter = (None, _row_from_unknown)  # (user type, row function) last used by refresh_user_list
+
+        # Device and sync calls run here, never on the Tk thread; the device serves one request at a time
+        self._executor = ThreadPoolExecutor(max_workers=1)
+
         # Set up style
         self.setup_style()
 
@@ -67,53 +155,24 @@ class UsersInterface:
         self.setup_ui()
 
         # Load data if not provided and service are available
+        # (the background load populates the list itself once the device has answered)
         if not self.users and self.device_service:
             self.load_users()
+        else:
+            self.refresh_user_list()
 
-        # Populate the user list
-        self.refresh_user_list()
+        # Keep child windows alive when closed so they can be reopened instantly
+        if root:
+            self.root.protocol("WM_DELETE_WINDOW", self.hide)
 
         # Show the window
         self.root.deiconify()
 
     def setup_style(self):
         """Configure styles for modern look."""
-        style = ttk.Style()
-        style.theme_use('clam')
-
         # Set base colors
         self.root.configure(background=self.COLOR_BACKGROUND)
-
-        # Configure styles
-        style.configure('TFrame', background=self.COLOR_BACKGROUND)
-        style.configure('Header.TFrame', background=self.COLOR_PRIMARY)
-        style.configure('Card.TFrame', background=self.COLOR_CARD, relief='flat', borderwidth=0)
-
-        # Add LabelFrame style
-        style.configure('TLabelframe', background=self.COLOR_BACKGROUND)
-        style.configure('TLabelframe.Label', background=self.COLOR_BACKGROUND, font=('Segoe UI', 9, 'bold'))
-
-        style.configure('TLabel', background=self.COLOR_BACKGROUND, font=('Segoe UI', 10))
-        style.configure('Card.TLabel', background=self.COLOR_CARD, font=('Segoe UI', 10))
-        style.configure('Header.TLabel', background=self.COLOR_PRIMARY, foreground='white',
-                        font=('Segoe UI', 12, 'bold'))
-        style.configure('Title.TLabel', background=self.COLOR_BACKGROUND, font=('Segoe UI', 14, 'bold'))
-        style.configure('SectionTitle.TLabel', background=self.COLOR_CARD, font=('Segoe UI', 12, 'bold'))
-
-        # Status label styles
-        style.configure('Success.TLabel', foreground=self.COLOR_SUCCESS, background=self.COLOR_CARD)
-        style.configure('Error.TLabel', foreground=self.COLOR_ERROR, background=self.COLOR_CARD)
-        style.configure('Warning.TLabel', foreground=self.COLOR_WARNING, background=self.COLOR_CARD)
-        style.configure('Neutral.TLabel', foreground=self.COLOR_NEUTRAL, background=self.COLOR_CARD)
-
-        # Button styles
-        style.configure('TButton', font=('Segoe UI', 10), padding=6)
-        style.configure('Action.TButton', padding=8)
-        style.configure('Delete.TButton', padding=8)
-
-        # Treeview styles
-        style.configure('Treeview', font=('Segoe UI', 10))
-        style.configure('Treeview.Heading', font=('Segoe UI', 10, 'bold'))
+        _ensure_styles_configured(self)
 
     def setup_ui(self):
         """Create and configure all UI elements."""
@@ -237,13 +296,7 @@ class UsersInterface:
 
     def resource_path(self, relative_path):
         """Get absolute path to resource, works for dev and for PyInstaller."""
-        try:
-            # PyInstaller creates a temp folder and stores path in _MEIPASS
-            base_path = sys._MEIPASS
-        except AttributeError:
-            base_path = os.path.abspath(".")
-
-        return os.path.join(base_path, relative_path)
+        return os.path.join(_BASE_PATH, relative_path)
 
     def create_user_list_card(self, parent):
         """Create card containing the user list."""
@@ -268,9 +321,10 @@ class UsersInterface:
         self.tree.column("user_id", width=150, anchor=tk.CENTER)
         self.tree.column("name", width=450, anchor=tk.W)
 
-        # Add vertical scrollbar
+        # Add vertical scrollbar; scrolling also renders more rows as the end of the rendered ones comes near
         vsb = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self.tree.yview)
-        self.tree.configure(yscroll=vsb.set)
+        self._vsb = vsb
+        self.tree.configure(yscroll=self.tree.register(self._on_tree_yscroll))
 
         # Add horizontal scrollbar
         hsb = ttk.Scrollbar(tree_frame, orient=tk.HORIZONTAL, command=self.tree.xview)
@@ -290,43 +344,57 @@ class UsersInterface:
 
     def show(self):
         """Make the window visible and set focus."""
+        self.root.deiconify()
+        self.root.lift()
         self.root.grab_set()  # Make this window modal
         self.root.transient(self.root.master)
         self.root.focus_set()  # Set keyboard focus
 
+    def hide(self):
+        """Hide the window so it can be reopened without being rebuilt."""
+        self.root.grab_release()
+        self.root.withdraw()
+
+    def refresh(self, users: Optional[List[User]] = None):
+        """Repopulate an existing window with a fresh user list."""
+        if users is not None:
+            self.users = users
+        self.refresh_user_list()
+
     def load_users(self):
-        """Load users from the device service."""
+        """Load users from the device service in the background, then refresh the list."""
         if not self.device_service:
             self.status_var.set("Service de l'appareil non disponible")
             self.status_label.config(style='Error.TLabel')
             return
 
-        try:
-            # Update status
-            self.status_var.set("Chargement des utilisateurs...")
-            self.status_label.config(style='Warning.TLabel')
-            self.root.update()  # Force UI update
+        self.status_var.set("Chargement des utilisateurs...")
+        self.status_label.config(style='Warning.TLabel')
 
-            # Retrieve users from the device service
-            self.users = self.device_service.get_users()
-
-            if not self.users:
-                logger.info("No users found from device service.")
-                self.status_var.set("Aucun utilisateur trouvé")
-                self.status_label.config(style='Warning.TLabel')
-                return
-
-            logger.info(f"Loaded {len(self.users)} users from device service")
-            self.status_var.set(f"{len(self.users)} utilisateurs chargés")
-            self.status_label.config(style='Success.TLabel')
+        # Reading users from the device can take seconds; the window stays responsive meanwhile.
+        # A list read moments ago (e.g. by the main window) is reused; imports and deletions invalidate it
+        fut = self._executor.submit(self.device_service.get_users_cached)
+        when_done(self.root, self._on_users_loaded, fut)
 
+    def _on_users_loaded(self, fut):
+        """Display the users fetched by load_users."""
+        if not self.root.winfo_exists():
+            return
+        try:
+            self.users = fut.result()
         except Exception as e:
             self.handle_error("Erreur lors du chargement des utilisateurs", e)
+            return
+
+        if self.users:
+            logger.info(f"Loaded {len(self.users)} users from device service")
+        else:
+            logger.info("No users found from device service.")
+        self.refresh_user_list()
 
     def refresh_data(self):
         """Refresh the user data and update the display."""
         self.load_users()
-        self.refresh_user_list()
 
     def import_users(self):
         """Import users using the sync service."""
@@ -338,17 +406,14 @@ class UsersInterface:
         try:
             self.status_var.set("Importation des utilisateurs...")
             self.status_label.config(style='Warning.TLabel')
-            self.root.update()  # Force UI update
 
-            threading.Thread(target=self.sync_service.import_users_from_api_to_device, daemon=True).start()
+            # The import runs first on the worker, so the reload queued behind it sees the imported users
+            self._executor.submit(self.sync_service.import_users_from_api_to_device)
             self.show_success(f"Le processus d'importation est en cours d'exécution en arrière-plan.")
 
             # Reload the user list after import
             self.load_users()
 
-            # Refresh the display
-            self.refresh_user_list()
-
         except Exception as e:
             self.handle_error("Erreur lors de l'importation des utilisateurs", e)
 
@@ -395,32 +460,51 @@ class UsersInterface:
             # Update status
             self.status_var.set("Suppression des utilisateurs...")
             self.status_label.config(style='Warning.TLabel')
-            self.root.update()  # Force UI update
-
-            # Delete users from device using the new bulk delete method
-            batch_size = 50
-            for i in range(0, len(uids), batch_size):
-                batch = uids[i:i + batch_size]
-                thread = threading.Thread(
-                    target=self.device_service.delete_users,
-                    args=(batch,),
-                    daemon=True
-                )
-                thread.start()
-            self.show_success(f"Le processus d'importation est en cours d'exécution en arrière-plan.")
 
-            # Refresh the display
-            self.refresh_user_list()
+            # One worker task deletes the batches in order; progress is shown until it completes
+            self._deleted_count = 0
+            fut = self._executor.submit(self._delete_batches, uids)
+            self.show_success(f"Le processus de suppression est en cours d'exécution en arrière-plan.")
+            self._poll_delete(fut, len(uids))
 
+        except Exception as e:
+            self.handle_error("Erreur lors de la suppression des utilisateurs", e)
 
+    def _delete_batches(self, uids: List[int]) -> int:
+        """Delete users from the device batch by batch (runs on the worker); return how many batches failed."""
+        failed = 0
+        for i in range(0, len(uids), self.DELETE_BATCH_SIZE):
+            # delete_users reports an unreachable device or a batch where nothing was deleted by returning False
+            if not self.device_service.delete_users(uids[i:i + self.DELETE_BATCH_SIZE]):
+                failed += 1
+            self._deleted_count = min(i + self.DELETE_BATCH_SIZE, len(uids))
+        return failed
+
+    def _poll_delete(self, fut, total: int):
+        """Show the deletion progress on the Tk thread, then reload the list once it is done."""
+        if not self.root.winfo_exists():
+            return
+        if not fut.done():
+            self.status_var.set(f"Suppression des utilisateurs... {self._deleted_count}/{total}")
+            self.root.after(POLL_MS, self._poll_delete, fut, total)
+            return
+        try:
+            failed = fut.result()
         except Exception as e:
             self.handle_error("Erreur lors de la suppression des utilisateurs", e)
+        else:
+            if failed:
+                self.show_error(f"La suppression a échoué pour {failed} lot(s) d'utilisateurs. "
+                                f"Vérifiez la connexion à l'appareil.")
+        self.load_users()
 
     def refresh_user_list(self):
         """Update the treeview with current user data."""
         # Clear existing items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        self.tree.delete(*self.tree.get_children())
+        self.tree.yview_moveto(0)
+        self._rows = []
+        self._rendered_count = 0
 
         # If no users, display a message in the status bar
         if not self.users or len(self.users) == 0:
@@ -428,36 +512,49 @@ class UsersInterface:
             self.status_label.config(style='Warning.TLabel')
             return
 
-        # Insert user data into the treeview
-        for user in self.users:
-            # Handle different types of user objects
-            if hasattr(user, 'id') and hasattr(user, 'user_id') and hasattr(user, 'name'):
-                # Complete user object with all fields
-                uid = user.id
-                user_id = user.user_id
-                name = user.name
-            elif hasattr(user, 'user_id') and hasattr(user, 'name'):
-                # User with user_id and name but missing id
-                uid = user.user_id  # Use user_id as fallback for uid
-                user_id = user.user_id
-                name = user.name
-            elif isinstance(user, dict):
-                # Dictionary representation of user
-                uid = user.get('id', user.get('user_id', 'N/A'))
-                user_id = user.get('user_id', 'N/A')
-                name = user.get('name', 'N/A')
-            else:
-                # Unknown format
-                uid = 'N/A'
-                user_id = 'N/A'
-                name = 'N/A'
+        # Format the user rows first; only the first chunk is inserted now, the rest as the user scrolls.
+        # The list is homogeneous, so the way to read a user is chosen from the first one
+        extractor = self._row_adapter_for(self.users[0])
+        self._rows = list(map(extractor, self.users))
 
-            self.tree.insert("", tk.END, values=(uid, user_id, name))
+        self._render_more_rows()
 
         # Update status message
         self.status_var.set(f"Affichage de {len(self.users)} utilisateurs")
         self.status_label.config(style='Success.TLabel')
 
+    def _row_adapter_for(self, sample) -> Callable[[object], tuple]:
+        """Return the function turning users shaped like sample into (uid, user_id, name) rows."""
+        # Remembered per type, so refreshes with the same kind of users skip the hasattr probing
+        if self._row_adapter[0] is not type(sample):
+            if hasattr(sample, 'id') and hasattr(sample, 'user_id') and hasattr(sample, 'name'):
+                adapter = _row_from_user
+            elif hasattr(sample, 'user_id') and hasattr(sample, 'name'):
+                adapter = _row_from_partial
+            elif isinstance(sample, dict):
+                adapter = _row_from_dict
+            else:
+                adapter = _row_from_unknown
+            self._row_adapter = (type(sample), adapter)
+        return self._row_adapter[1]
+
+    def _render_more_rows(self, count: Optional[int] = None):
+        """Insert the next chunk of user rows (RENDER_CHUNK unless count is given) into the treeview."""
+        self._render_pending = False
+        start = self._rendered_count
+        chunk = self._rows[start:start + (count or self.RENDER_CHUNK)]
+        self._rendered_count = start + len(chunk)
+        if chunk:
+            self.tree.tk.call('apply', self._INSERT_ROWS, self.tree._w, tuple(chunk))
+
+    def _on_tree_yscroll(self, first, last):
+        """Update the scrollbar and schedule more rows when the view nears the last rendered one."""
+        self._vsb.set(first, last)
+        if float(last) >= self.RENDER_AHEAD and not self._render_pending \
+                and self._rendered_count < len(self._rows):
+            self._render_pending = True
+            self.root.after_idle(self._render_more_rows)
+
     def on_user_double_click(self, event):
         """Handle double-click on a user row (placeholder for future functionality)."""
         if not self.tree.selection():
@@ -475,12 +572,11 @@ class UsersInterface:
 
     def select_all_users(self):
         """Select all users in the treeview."""
-        # Clear current selection
-        self.tree.selection_remove(self.tree.selection())
+        # Every user must have a row to be selected, including those not scrolled to yet
+        self._render_more_rows(len(self._rows) - self._rendered_count)
 
-        # Select all items
-        for item in self.tree.get_children():
-            self.tree.selection_add(item)
+        # Select all items, replacing the current selection
+        self.tree.selection_set(self.tree.get_children())
 
         # Update status
         items_count = len(self.tree.get_children())